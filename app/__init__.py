@@ -12,7 +12,7 @@ from typing import Optional
 from flask import Flask, render_template
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-from app.config import config
+from app.config import get_config
 from app.extensions import db, login_manager, csrf, migrate, talisman, limiter
 
 
@@ -31,7 +31,11 @@ def create_app(config_name: Optional[str] = None) -> Flask:
         config_name = os.environ.get('FLASK_CONFIG', 'development')
     
     app = Flask(__name__)
-    app.config.from_object(config[config_name])
+    app.config.from_object(get_config(config_name))
+
+    # Faster JSON responses: no key sorting, model types handled centrally
+    from app.services.json import AppJSONProvider
+    app.json = AppJSONProvider(app)
     
     # Configure logging
     configure_logging(app)
@@ -54,7 +58,10 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     
     # Register context processors
     register_context_processors(app)
-    
+
+    # Warm one-time form class setup out of the first request
+    warm_form_classes(app)
+
     return app
 
 
@@ -85,7 +92,7 @@ def initialise_extensions(app: Flask) -> None:
     if app.config.get('TALISMAN_ENABLED', False):
         talisman.init_app(
             app,
-            content_security_policy=app.config.get('CSP_POLICY'),
+            content_security_policy=_serialise_csp(app.config.get('CSP_POLICY')),
             force_https=app.config.get('FORCE_HTTPS', True),
             frame_options='DENY',
             referrer_policy='strict-origin-when-cross-origin',
@@ -100,8 +107,41 @@ def initialise_extensions(app: Flask) -> None:
     
     @login_manager.user_loader
     def load_user(user_id: str):
+        from flask import g, request
         from app.models.user import User
-        return User.query.get(int(user_id))
+        # Static assets never consult the user; skip the lookup entirely
+        if request.endpoint == 'static':
+            return None
+        # Memoise on g so repeated loads within one request share a
+        # single lookup; session.get also consults the identity map
+        # before touching the database.
+        if 'user' not in g:
+            g.user = db.session.get(User, int(user_id))
+        return g.user
+
+
+def _serialise_csp(policy) -> Optional[str]:
+    """
+    Serialise a CSP policy dict into a header string once at startup.
+
+    Talisman re-serialises dict policies on every response; handing it a
+    pre-built string makes the per-response work a constant header copy.
+
+    Args:
+        policy: CSP policy as a dict, string, or None.
+
+    Returns:
+        Policy header string, or None if no policy is set.
+    """
+    if policy is None or isinstance(policy, str):
+        return policy
+    parts = []
+    for directive, sources in policy.items():
+        if isinstance(sources, str):
+            parts.append(f'{directive} {sources}')
+        else:
+            parts.append(f"{directive} {' '.join(sources)}")
+    return '; '.join(parts)
 
 
 def register_blueprints(app: Flask) -> None:
@@ -127,9 +167,30 @@ def register_cli_commands(app: Flask) -> None:
     register_commands(app)
 
 
+def warm_form_classes(app: Flask) -> None:
+    """
+    Instantiate the hot-path form classes once at startup.
+
+    WTForms populates each class's bound-field cache lazily on first
+    instantiation; doing it here keeps that one-time cost (and the
+    validators' setup work) out of the first login/registration request.
+    """
+    from app.forms.auth import LoginForm, RegistrationForm
+    from app.forms.items import ItemForm, ItemSearchForm
+
+    with app.test_request_context():
+        for form_class in (LoginForm, RegistrationForm, ItemForm, ItemSearchForm):
+            form_class(meta={'csrf': False})
+
+
 def register_error_handlers(app: Flask) -> None:
     """Register error handlers."""
-    
+
+    # Warm the Jinja compile cache for the error templates at startup so
+    # the first error response doesn't pay template compilation cost.
+    for code in (400, 403, 404, 500):
+        app.jinja_env.get_template(f'errors/{code}.html')
+
     @app.errorhandler(400)
     def bad_request(error):
         return render_template('errors/400.html'), 400
@@ -150,12 +211,18 @@ def register_error_handlers(app: Flask) -> None:
 
 def register_context_processors(app: Flask) -> None:
     """Register template context processors."""
-    
+    from datetime import datetime, timedelta
+    from flask import g
+
+    # Static globals built once; only 'now' varies, and it is cached on
+    # g so repeated renders within a request share one clock read.
+    static_globals = {
+        'expiry_warning_days': app.config.get('EXPIRY_WARNING_DAYS', 3),
+        'timedelta': timedelta,
+    }
+
     @app.context_processor
     def inject_globals():
-        from datetime import datetime, timedelta
-        return {
-            'now': datetime.utcnow(),
-            'expiry_warning_days': 3,
-            'timedelta': timedelta,
-        }
+        if 'template_now' not in g:
+            g.template_now = datetime.utcnow()
+        return {'now': g.template_now, **static_globals}
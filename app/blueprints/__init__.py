@@ -1,19 +1,28 @@
 """
 Blueprints package.
+
+Blueprint modules are imported lazily (PEP 562) so that importing
+``app.blueprints`` does not pull in every model, form, and service.
+``create_app`` imports each blueprint module directly when registering;
+attribute access here is only for convenience imports.
 """
 
-from app.blueprints.main import main_bp
-from app.blueprints.auth import auth_bp
-from app.blueprints.items import items_bp
-from app.blueprints.recipes import recipes_bp
-from app.blueprints.sites import sites_bp
-from app.blueprints.admin import admin_bp
+import importlib
+
+_BLUEPRINT_MODULES = {
+    'main_bp': 'app.blueprints.main',
+    'auth_bp': 'app.blueprints.auth',
+    'items_bp': 'app.blueprints.items',
+    'recipes_bp': 'app.blueprints.recipes',
+    'sites_bp': 'app.blueprints.sites',
+    'admin_bp': 'app.blueprints.admin',
+}
+
+__all__ = list(_BLUEPRINT_MODULES)
+
 
-__all__ = [
-    'main_bp',
-    'auth_bp',
-    'items_bp',
-    'recipes_bp',
-    'sites_bp',
-    'admin_bp',
-]
+def __getattr__(name):
+    """Resolve blueprint attributes on first access."""
+    if name in _BLUEPRINT_MODULES:
+        return getattr(importlib.import_module(_BLUEPRINT_MODULES[name]), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
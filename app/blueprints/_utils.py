@@ -0,0 +1,32 @@
+"""
+Shared helpers for SmartFridge blueprints.
+"""
+
+from flask import abort
+from flask_login import current_user
+
+from app.extensions import db
+
+
+def get_owned_or_404(model, id: int):
+    """
+    Load a record by primary key and verify the current user owns it.
+
+    Uses session.get, which consults the identity map before querying,
+    so a record already loaded in this request costs no extra SELECT;
+    the ownership check moves into Python with identical 404 behaviour.
+
+    Args:
+        model: Model class with an owner_id column.
+        id: Primary key to look up.
+
+    Returns:
+        The owned model instance.
+
+    Raises:
+        NotFound: If no such record exists or it belongs to another user.
+    """
+    obj = db.session.get(model, id)
+    if obj is None or obj.owner_id != current_user.id:
+        abort(404)
+    return obj
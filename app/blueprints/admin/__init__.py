@@ -5,62 +5,144 @@ Handles user management and system administration.
 """
 
 from functools import wraps
-from flask import Blueprint, render_template, redirect, url_for, flash, request, abort
-from flask_login import login_required, current_user
+from flask import Blueprint, current_app, render_template, redirect, url_for, flash, request, abort
+from flask_login import current_user
+from sqlalchemy import case, func, or_, select, update
+from sqlalchemy.orm import aliased, load_only
 
 from app.extensions import db
+from app.services.cache import TTLCache
 from app.models.user import User, UserRole
-from app.forms.admin import (
-    UserEditForm,
-    AdminResetPasswordForm,
-    CreateUserForm,
-    UserSearchForm,
-)
-from app.services.security.password import PasswordService
 
 
 admin_bp = Blueprint('admin', __name__)
 
+# Page size for user listings - keeps response time and memory
+# independent of the size of the users table
+USERS_PER_PAGE = 50
+
+# Short-lived cache for the dashboard statistics block
+_stats_cache = TTLCache(default_ttl=30.0)
+_STATS_CACHE_KEY = 'admin_stats'
+
+
+def _invalidate_stats_cache() -> None:
+    """Drop the cached dashboard statistics after a user mutation."""
+    _stats_cache.delete(_STATS_CACHE_KEY)
+
 
 def admin_required(f):
     """Decorator to require admin role."""
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:
+        # Dereference the current_user proxy once; each attribute access
+        # through the LocalProxy costs a context lookup.
+        user = current_user._get_current_object()
+        if not user.is_authenticated:
             return redirect(url_for('auth.login'))
-        if not current_user.is_admin:
+        if not user.is_admin:
             abort(403)
         return f(*args, **kwargs)
     return decorated_function
 
 
-@admin_bp.route('/')
-@login_required
-@admin_required
-def index():
-    """Admin dashboard."""
+def _get_content_counts(user_ids):
+    """
+    Get per-user item and recipe counts in two grouped queries.
+
+    Avoids the per-row lazy loads triggered by counting relationships
+    in the users list template.
+
+    Args:
+        user_ids: List of user IDs to count content for.
+
+    Returns:
+        Tuple of (item_counts, recipe_counts) dicts keyed by user ID.
+    """
+    from app.models.item import Item
+    from app.models.recipe import Recipe
+
+    if not user_ids:
+        return {}, {}
+
+    item_counts = dict(
+        db.session.query(Item.owner_id, func.count(Item.id))
+        .filter(Item.owner_id.in_(user_ids))
+        .group_by(Item.owner_id)
+        .all()
+    )
+    recipe_counts = dict(
+        db.session.query(Recipe.owner_id, func.count(Recipe.id))
+        .filter(Recipe.owner_id.in_(user_ids))
+        .group_by(Recipe.owner_id)
+        .all()
+    )
+    return item_counts, recipe_counts
+
+
+def _compute_admin_stats() -> dict:
+    """
+    Compute the dashboard statistics block.
+
+    Uses conditional aggregates so each table is scanned once instead of
+    issuing one COUNT query per statistic.
+
+    Returns:
+        Dict of statistic name to value.
+    """
     from app.models.item import Item
     from app.models.recipe import Recipe
     from app.models.site import Site
-    
-    # Get statistics
-    stats = {
-        'total_users': User.query.count(),
-        'active_users': User.query.filter_by(is_active=True, is_approved=True).count(),
-        'admin_users': User.query.filter_by(role=UserRole.ADMIN.value).count(),
-        'pending_users': User.query.filter_by(is_approved=False).count(),
-        'total_items': Item.query.count(),
-        'total_recipes': Recipe.query.count(),
-        'total_sites': Site.query.count(),
-        'expired_items': Item.query.filter(Item.expiry_date < db.func.current_date()).count(),
-        'ai_recipes': Recipe.query.filter_by(is_ai_generated=True).count(),
+
+    user_stats = db.session.query(
+        func.count(User.id),
+        func.sum(case((User.is_active & User.is_approved, 1), else_=0)),
+        func.sum(case((User.role == UserRole.ADMIN.value, 1), else_=0)),
+        func.sum(case((~User.is_approved, 1), else_=0)),
+    ).one()
+    item_stats = db.session.query(
+        func.count(Item.id),
+        func.sum(case((Item.expiry_date < func.current_date(), 1), else_=0)),
+    ).one()
+    recipe_stats = db.session.query(
+        func.count(Recipe.id),
+        func.sum(case((Recipe.is_ai_generated, 1), else_=0)),
+    ).one()
+
+    return {
+        'total_users': user_stats[0],
+        'active_users': int(user_stats[1] or 0),
+        'admin_users': int(user_stats[2] or 0),
+        'pending_users': int(user_stats[3] or 0),
+        'total_items': item_stats[0],
+        'total_recipes': recipe_stats[0],
+        'total_sites': db.session.query(func.count(Site.id)).scalar(),
+        'expired_items': int(item_stats[1] or 0),
+        'ai_recipes': int(recipe_stats[1] or 0),
     }
-    
-    # Recent users
-    recent_users = User.query.order_by(User.created_at.desc()).limit(5).all()
-    
-    # Pending approval users
-    pending_approval = User.get_pending_users()[:5]  # Show first 5
+
+
+@admin_bp.route('/')
+@admin_required
+def index():
+    """Admin dashboard."""
+    ttl = current_app.config.get('ADMIN_STATS_CACHE_SECONDS', 30)
+    if ttl > 0:
+        stats = _stats_cache.get_or_set(_STATS_CACHE_KEY, _compute_admin_stats, ttl=ttl)
+    else:
+        stats = _compute_admin_stats()
+
+    # Recent users - only the columns the dashboard shows, so the
+    # password hash and other unused columns stay out of the payload
+    recent_users = User.query.options(
+        load_only(
+            User.id, User.username, User.email, User.role,
+            User.is_active, User.is_approved, User.created_at,
+        )
+    ).order_by(User.created_at.desc()).limit(5).all()
+
+    # Pending approval users - limited in SQL instead of slicing
+    pending_approval = User.get_pending_users(limit=5)
     
     return render_template(
         'admin/index.html',
@@ -71,40 +153,57 @@ def index():
 
 
 @admin_bp.route('/users')
-@login_required
 @admin_required
 def users():
     """List all users."""
+    # Form imports are deferred so registering the blueprint (and any
+    # process that never serves admin pages) skips the WTForms setup cost
+    from app.forms.admin import UserSearchForm
+
     form = UserSearchForm(request.args, meta={'csrf': False})
-    
-    query = User.query
-    
+
+    stmt = select(User)
+
     if form.search.data:
         search_term = f'%{form.search.data}%'
-        query = query.filter(
+        stmt = stmt.where(
             (User.username.ilike(search_term)) |
             (User.email.ilike(search_term))
         )
-    
+
     if form.role.data:
-        query = query.filter_by(role=form.role.data)
-    
+        stmt = stmt.where(User.role == form.role.data)
+
     if form.status.data:
         if form.status.data == 'active':
-            query = query.filter_by(is_active=True)
+            stmt = stmt.where(User.is_active.is_(True))
         elif form.status.data == 'inactive':
-            query = query.filter_by(is_active=False)
-    
-    users = query.order_by(User.created_at.desc()).all()
-    
-    return render_template('admin/users.html', users=users, form=form)
+            stmt = stmt.where(User.is_active.is_(False))
+
+    page = request.args.get('page', 1, type=int)
+    pagination = db.paginate(
+        stmt.order_by(User.created_at.desc()),
+        page=page, per_page=USERS_PER_PAGE, error_out=False,
+    )
+
+    item_counts, recipe_counts = _get_content_counts([user.id for user in pagination.items])
+
+    return render_template(
+        'admin/users.html',
+        users=pagination.items,
+        pagination=pagination,
+        form=form,
+        item_counts=item_counts,
+        recipe_counts=recipe_counts,
+    )
 
 
 @admin_bp.route('/users/new', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def create_user():
     """Create a new user."""
+    from app.forms.admin import CreateUserForm
+
     form = CreateUserForm()
     
     if form.validate_on_submit():
@@ -116,6 +215,7 @@ def create_user():
             is_approved=True  # Admin-created users are auto-approved
         )
         
+        _invalidate_stats_cache()
         flash(f'User "{user.username}" has been created.', 'success')
         return redirect(url_for('admin.users'))
     
@@ -123,7 +223,6 @@ def create_user():
 
 
 @admin_bp.route('/users/<int:id>')
-@login_required
 @admin_required
 def view_user(id):
     """View user details."""
@@ -132,28 +231,30 @@ def view_user(id):
 
 
 @admin_bp.route('/users/<int:id>/edit', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def edit_user(id):
     """Edit user details."""
+    from app.forms.admin import UserEditForm
+
     user = User.query.get_or_404(id)
-    
+
     form = UserEditForm(user_id=user.id, obj=user)
     
     if form.validate_on_submit():
         # Prevent removing the last admin
-        if (user.is_admin and 
+        if (user.is_admin and
             form.role.data != UserRole.ADMIN.value and
-            User.query.filter_by(role=UserRole.ADMIN.value).count() == 1):
+            not User.has_other_admin(user.id)):
             flash('Cannot remove the last administrator.', 'danger')
             return render_template('admin/user_form.html', form=form, user=user, title='Edit User')
         
         user.username = form.username.data
-        user.email = form.email.data.lower()
+        user.email = form.email.data.strip().lower()
         user.role = form.role.data
         user.is_active = form.is_active.data
         
         db.session.commit()
+        _invalidate_stats_cache()
         
         flash(f'User "{user.username}" has been updated.', 'success')
         return redirect(url_for('admin.users'))
@@ -162,12 +263,13 @@ def edit_user(id):
 
 
 @admin_bp.route('/users/<int:id>/reset-password', methods=['GET', 'POST'])
-@login_required
 @admin_required
 def reset_password(id):
     """Reset a user's password."""
+    from app.forms.admin import AdminResetPasswordForm
+
     user = User.query.get_or_404(id)
-    
+
     form = AdminResetPasswordForm()
     
     if form.validate_on_submit():
@@ -181,44 +283,73 @@ def reset_password(id):
 
 
 @admin_bp.route('/users/<int:id>/deactivate', methods=['POST'])
-@login_required
 @admin_required
 def deactivate_user(id):
     """Deactivate a user account."""
+    # Single guarded UPDATE: the self-deactivation and last-admin checks
+    # live in the WHERE clause, so the guard and the state change cannot
+    # race against a concurrent admin demotion.
+    other_admin = aliased(User)
+    result = db.session.execute(
+        update(User)
+        .where(
+            User.id == id,
+            User.id != current_user.id,
+            or_(
+                User.role != UserRole.ADMIN.value,
+                select(other_admin.id)
+                .where(
+                    other_admin.role == UserRole.ADMIN.value,
+                    other_admin.is_active.is_(True),
+                    other_admin.id != id,
+                )
+                .exists(),
+            ),
+        )
+        .values(is_active=False)
+        .returning(User.username)
+    )
+    row = result.first()
+    db.session.commit()
+
+    if row is not None:
+        _invalidate_stats_cache()
+        flash(f'User "{row.username}" has been deactivated.', 'success')
+        return redirect(url_for('admin.users'))
+
+    # Guard rejected the update - fetch the row to pick the right message
     user = User.query.get_or_404(id)
-    
-    # Prevent self-deactivation
     if user.id == current_user.id:
         flash('You cannot deactivate your own account.', 'danger')
-        return redirect(url_for('admin.users'))
-    
-    # Prevent deactivating the last admin
-    if (user.is_admin and
-        User.query.filter_by(role=UserRole.ADMIN.value, is_active=True).count() == 1):
+    else:
         flash('Cannot deactivate the last active administrator.', 'danger')
-        return redirect(url_for('admin.users'))
-    
-    user.deactivate()
-    
-    flash(f'User "{user.username}" has been deactivated.', 'success')
     return redirect(url_for('admin.users'))
 
 
 @admin_bp.route('/users/<int:id>/activate', methods=['POST'])
-@login_required
 @admin_required
 def activate_user(id):
     """Activate a user account."""
-    user = User.query.get_or_404(id)
-    
-    user.activate()
-    
-    flash(f'User "{user.username}" has been activated.', 'success')
+    # SELECT-then-UPDATE collapsed into one UPDATE ... RETURNING
+    result = db.session.execute(
+        update(User)
+        .where(User.id == id)
+        .values(is_active=True)
+        .returning(User.username)
+    )
+    row = result.first()
+    db.session.commit()
+
+    if row is None:
+        abort(404)
+
+    _invalidate_stats_cache()
+
+    flash(f'User "{row.username}" has been activated.', 'success')
     return redirect(url_for('admin.users'))
 
 
 @admin_bp.route('/users/<int:id>/delete', methods=['POST'])
-@login_required
 @admin_required
 def delete_user(id):
     """Delete a user account."""
@@ -231,13 +362,14 @@ def delete_user(id):
     
     # Prevent deleting the last admin
     if (user.is_admin and
-        User.query.filter_by(role=UserRole.ADMIN.value).count() == 1):
+        not User.has_other_admin(user.id)):
         flash('Cannot delete the last administrator.', 'danger')
         return redirect(url_for('admin.users'))
     
     username = user.username
     db.session.delete(user)
     db.session.commit()
+    _invalidate_stats_cache()
     
     flash(f'User "{username}" has been deleted.', 'success')
     return redirect(url_for('admin.users'))
@@ -248,33 +380,46 @@ def delete_user(id):
 # ============================================================================
 
 @admin_bp.route('/users/pending')
-@login_required
 @admin_required
 def pending_users():
     """List all users pending approval."""
-    users = User.get_pending_users()
-    return render_template('admin/pending_users.html', users=users)
+    page = request.args.get('page', 1, type=int)
+    pagination = User.query.filter_by(is_approved=False)\
+        .order_by(User.created_at.asc())\
+        .paginate(page=page, per_page=USERS_PER_PAGE, error_out=False)
+    return render_template(
+        'admin/pending_users.html',
+        users=pagination.items,
+        pagination=pagination,
+    )
 
 
 @admin_bp.route('/users/<int:id>/approve', methods=['POST'])
-@login_required
 @admin_required
 def approve_user(id):
     """Approve a user registration."""
-    user = User.query.get_or_404(id)
-    
-    if user.is_approved:
-        flash(f'User "{user.username}" is already approved.', 'info')
+    # Single UPDATE guarded on the pending state; only the rare
+    # already-approved/missing cases need a follow-up SELECT
+    result = db.session.execute(
+        update(User)
+        .where(User.id == id, User.is_approved.is_(False))
+        .values(is_approved=True)
+        .returning(User.username)
+    )
+    row = result.first()
+    db.session.commit()
+
+    if row is not None:
+        _invalidate_stats_cache()
+        flash(f'User "{row.username}" has been approved and can now log in.', 'success')
         return redirect(url_for('admin.pending_users'))
-    
-    user.approve()
-    
-    flash(f'User "{user.username}" has been approved and can now log in.', 'success')
+
+    user = User.query.get_or_404(id)
+    flash(f'User "{user.username}" is already approved.', 'info')
     return redirect(url_for('admin.pending_users'))
 
 
 @admin_bp.route('/users/<int:id>/reject', methods=['POST'])
-@login_required
 @admin_required
 def reject_user(id):
     """Reject a user registration (deletes the account)."""
@@ -286,28 +431,27 @@ def reject_user(id):
     
     username = user.username
     user.reject()
+    _invalidate_stats_cache()
     
     flash(f'User "{username}" registration has been rejected and removed.', 'success')
     return redirect(url_for('admin.pending_users'))
 
 
 @admin_bp.route('/users/approve-all', methods=['POST'])
-@login_required
 @admin_required
 def approve_all_users():
     """Approve all pending user registrations."""
-    pending = User.get_pending_users()
-    
-    if not pending:
+    # Single UPDATE instead of loading and mutating each row
+    count = User.query.filter_by(is_approved=False).update(
+        {'is_approved': True}, synchronize_session=False
+    )
+    db.session.commit()
+
+    if not count:
         flash('No pending users to approve.', 'info')
         return redirect(url_for('admin.pending_users'))
-    
-    count = 0
-    for user in pending:
-        user.is_approved = True
-        count += 1
-    
-    db.session.commit()
-    
+
+    _invalidate_stats_cache()
+
     flash(f'{count} user(s) have been approved.', 'success')
     return redirect(url_for('admin.pending_users'))
@@ -4,7 +4,6 @@ Authentication blueprint for SmartFridge application.
 Handles user registration, login, logout, and password management.
 """
 
-from datetime import datetime
 from flask import Blueprint, render_template, redirect, url_for, flash, request
 from flask_login import login_user, logout_user, login_required, current_user
 
@@ -68,11 +67,10 @@ def login():
             flash('Your account has been deactivated. Please contact support.', 'warning')
             return render_template('auth/login.html', form=form)
         
-        # Update last login
-        user.last_login = datetime.utcnow()
-        db.session.commit()
-        
         login_user(user, remember=form.remember_me.data)
+
+        # Record last login with a single UPDATE after the session is set up
+        user.update_last_login()
         
         # Handle next URL for protected pages
         next_page = request.args.get('next')
@@ -4,13 +4,21 @@ Items blueprint for SmartFridge application.
 Handles CRUD operations for fridge items including barcode scanning.
 """
 
-from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
+from datetime import date, timedelta
+
+from flask import (
+    Blueprint, Response, current_app, render_template, redirect, url_for,
+    flash, request, jsonify, stream_with_context,
+)
 from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
 
 from app.extensions import db
 from app.models.item import Item, ItemCategory, ExpiryStatus
 from app.forms.items import ItemForm, ItemSearchForm
 from app.services.barcode import lookup_barcode
+from app.blueprints.main import invalidate_dashboard_stats
+from app.blueprints._utils import get_owned_or_404
 
 
 items_bp = Blueprint('items', __name__)
@@ -21,8 +29,11 @@ items_bp = Blueprint('items', __name__)
 def index():
     """List all items for the current user."""
     form = ItemSearchForm(request.args, meta={'csrf': False})
-    
-    query = Item.query.filter_by(owner_id=current_user.id)
+
+    # The listing template reads only Item's own columns; raiseload
+    # turns any accidental lazy relationship load into a loud error
+    # instead of a silent per-row SELECT
+    query = Item.query.filter_by(owner_id=current_user.id).options(raiseload('*'))
     
     # Apply search filter
     if form.search.data:
@@ -35,7 +46,6 @@ def index():
     
     # Apply status filter
     if form.status.data:
-        from datetime import date, timedelta
         today = date.today()
         
         if form.status.data == 'fresh':
@@ -87,6 +97,7 @@ def new():
             notes=form.notes.data
         )
         
+        invalidate_dashboard_stats(current_user.id)
         flash(f'"{item.name}" has been added to your fridge.', 'success')
         return redirect(url_for('items.index'))
     
@@ -97,7 +108,7 @@ def new():
 @login_required
 def edit(id):
     """Edit an existing item."""
-    item = Item.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    item = get_owned_or_404(Item, id)
     
     form = ItemForm(obj=item)
     
@@ -112,6 +123,7 @@ def edit(id):
         
         db.session.commit()
         
+        invalidate_dashboard_stats(current_user.id)
         flash(f'"{item.name}" has been updated.', 'success')
         return redirect(url_for('items.index'))
     
@@ -122,12 +134,13 @@ def edit(id):
 @login_required
 def delete(id):
     """Delete an item."""
-    item = Item.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    item = get_owned_or_404(Item, id)
     
     name = item.name
     db.session.delete(item)
     db.session.commit()
     
+    invalidate_dashboard_stats(current_user.id)
     flash(f'"{name}" has been removed from your fridge.', 'success')
     return redirect(url_for('items.index'))
 
@@ -136,7 +149,7 @@ def delete(id):
 @login_required
 def view(id):
     """View a single item."""
-    item = Item.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    item = get_owned_or_404(Item, id)
     return render_template('items/view.html', item=item)
 
 
@@ -160,21 +173,20 @@ def expiring():
 @login_required
 def bulk_delete():
     """Delete multiple items."""
-    item_ids = request.form.getlist('item_ids')
-    
+    item_ids = [int(item_id) for item_id in request.form.getlist('item_ids')]
+
     if not item_ids:
         flash('No items selected.', 'warning')
         return redirect(url_for('items.index'))
-    
-    count = 0
-    for item_id in item_ids:
-        item = Item.query.filter_by(id=int(item_id), owner_id=current_user.id).first()
-        if item:
-            db.session.delete(item)
-            count += 1
-    
+
+    # Single scoped DELETE instead of a SELECT + DELETE per item
+    count = Item.query.filter(
+        Item.owner_id == current_user.id,
+        Item.id.in_(item_ids),
+    ).delete(synchronize_session=False)
     db.session.commit()
-    
+
+    invalidate_dashboard_stats(current_user.id)
     flash(f'{count} item(s) have been removed.', 'success')
     return redirect(url_for('items.index'))
 
@@ -183,28 +195,60 @@ def bulk_delete():
 @items_bp.route('/api/items', methods=['GET'])
 @login_required
 def api_list():
-    """API: Get all items as JSON."""
-    items = Item.get_by_owner(current_user.id)
-    return jsonify([{
-        'id': item.id,
-        'name': item.name,
-        'quantity': item.quantity,
-        'category': item.category,
-        'expiry_date': item.expiry_date.isoformat() if item.expiry_date else None,
-        'expiry_status': item.expiry_status.value,
-        'days_until_expiry': item.days_until_expiry,
-    } for item in items])
+    """API: Get all items as JSON, streamed row by row."""
+    # Column projection: plain Row tuples skip ORM instance
+    # construction and identity-map bookkeeping for this read-only path
+    query = (
+        db.session.query(
+            Item.id, Item.name, Item.quantity, Item.category, Item.expiry_date
+        )
+        .filter_by(owner_id=current_user.id)
+        .order_by(Item.expiry_date.asc().nullslast())
+    )
+    today = date.today()
+
+    def generate():
+        # Stream the array incrementally so peak memory stays at one
+        # DB batch rather than the whole inventory plus its JSON
+        dumps = current_app.json.dumps
+        yield '['
+        first = True
+        for item_id, name, quantity, category, expiry_date in query.yield_per(500):
+            days_until = (expiry_date - today).days if expiry_date else None
+            if days_until is None:
+                status = ExpiryStatus.FRESH
+            elif days_until < 0:
+                status = ExpiryStatus.EXPIRED
+            elif days_until <= 3:
+                status = ExpiryStatus.WARNING
+            else:
+                status = ExpiryStatus.FRESH
+            prefix = '' if first else ','
+            first = False
+            yield prefix + dumps({
+                'id': item_id,
+                'name': name,
+                'quantity': quantity,
+                'category': category,
+                'expiry_date': expiry_date,
+                'expiry_status': status,
+                'days_until_expiry': days_until,
+            })
+        yield ']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @items_bp.route('/api/items/<int:id>', methods=['DELETE'])
 @login_required
 def api_delete(id):
     """API: Delete an item."""
-    item = Item.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    item = get_owned_or_404(Item, id)
     
     db.session.delete(item)
     db.session.commit()
     
+    invalidate_dashboard_stats(current_user.id)
     return jsonify({'success': True, 'message': 'Item deleted'})
 
 
@@ -260,23 +304,26 @@ def api_add_by_barcode():
     # Parse expiry date if provided
     expiry_date = None
     if data.get('expiry_date'):
-        from datetime import datetime
         try:
-            expiry_date = datetime.strptime(data['expiry_date'], '%Y-%m-%d').date()
+            expiry_date = date.fromisoformat(data['expiry_date'])
         except ValueError:
             pass
     
-    item = Item.create(
-        owner_id=current_user.id,
-        name=name,
-        quantity=data.get('quantity', '1'),
-        category=data.get('category', 'other'),
-        expiry_date=expiry_date,
-        barcode=barcode,
-        brand=data.get('brand'),
-        notes=data.get('notes')
-    )
+    try:
+        item = Item.create(
+            owner_id=current_user.id,
+            name=name,
+            quantity=data.get('quantity', '1'),
+            category=data.get('category', 'other'),
+            expiry_date=expiry_date,
+            barcode=barcode,
+            brand=data.get('brand'),
+            notes=data.get('notes')
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
     
+    invalidate_dashboard_stats(current_user.id)
     return jsonify({
         'success': True,
         'message': f'"{item.name}" added to your fridge',
@@ -4,16 +4,64 @@ Main blueprint for SmartFridge application.
 Handles the dashboard and home page.
 """
 
-from flask import Blueprint, render_template
+from flask import Blueprint, current_app, render_template
 from flask_login import login_required, current_user
+from sqlalchemy import func, select
 
+from app.extensions import db
 from app.models.item import Item
 from app.models.recipe import Recipe
 from app.models.site import Site
+from app.services.cache import TTLCache
 
 
 main_bp = Blueprint('main', __name__)
 
+# Short-lived per-user cache for the dashboard counts; the expiring and
+# expired item lists are always fetched fresh
+_stats_cache = TTLCache(default_ttl=60.0)
+
+
+def invalidate_dashboard_stats(user_id: int) -> None:
+    """Drop a user's cached dashboard counts after a content mutation."""
+    _stats_cache.delete(user_id)
+
+
+def _load_dashboard_stats(user_id: int) -> dict:
+    """
+    Compute the dashboard counts and category breakdown for a user.
+
+    Args:
+        user_id: Owner whose content is summarised.
+
+    Returns:
+        Dict with total_items, total_recipes, total_sites and categories.
+    """
+    category_counts = (
+        db.session.query(Item.category, func.count())
+        .filter_by(owner_id=user_id)
+        .group_by(Item.category)
+        .all()
+    )
+    categories = {
+        category.replace('_', ' ').title(): count
+        for category, count in category_counts
+    }
+    # Flat COUNT(id) selects; Query.count() wraps the query in a
+    # subquery before counting
+    total_recipes = db.session.scalar(
+        select(func.count(Recipe.id)).where(Recipe.owner_id == user_id)
+    )
+    total_sites = db.session.scalar(
+        select(func.count(Site.id)).where(Site.owner_id == user_id)
+    )
+    return {
+        'total_items': sum(categories.values()),
+        'total_recipes': total_recipes,
+        'total_sites': total_sites,
+        'categories': categories,
+    }
+
 
 @main_bp.route('/')
 def index():
@@ -27,30 +75,30 @@ def index():
 @login_required
 def dashboard():
     """User dashboard with overview of items, recipes, and sites."""
-    # Get item statistics
-    items = Item.get_by_owner(current_user.id)
-    expiring_items = Item.get_expiring_soon(current_user.id, days=3)
-    expired_items = Item.get_expired(current_user.id)
-    
-    # Get counts
-    total_items = len(items)
-    total_recipes = Recipe.query.filter_by(owner_id=current_user.id).count()
-    total_sites = Site.query.filter_by(owner_id=current_user.id).count()
-    
-    # Category breakdown
-    categories = {}
-    for item in items:
-        cat = item.category.replace('_', ' ').title()
-        categories[cat] = categories.get(cat, 0) + 1
-    
+    # Get item statistics: totals via one conditional-aggregation pass,
+    # full rows only for the five-entry previews the template renders
+    expiring_count, expired_count = Item.get_expiry_counts(current_user.id, days=3)
+    expiring_items = Item.get_expiring_soon(current_user.id, days=3, limit=5)
+    expired_items = Item.get_expired(current_user.id, limit=5)
+
+    # Counts and the category breakdown tolerate short staleness, so
+    # they are cached per user and invalidated on content mutations
+    ttl = current_app.config.get('DASHBOARD_STATS_CACHE_SECONDS', 60)
+    user_id = current_user.id
+    if ttl > 0:
+        stats = _stats_cache.get_or_set(
+            user_id, lambda: _load_dashboard_stats(user_id), ttl=ttl
+        )
+    else:
+        stats = _load_dashboard_stats(user_id)
+
     return render_template(
         'main/dashboard.html',
-        total_items=total_items,
-        total_recipes=total_recipes,
-        total_sites=total_sites,
         expiring_items=expiring_items,
         expired_items=expired_items,
-        categories=categories,
+        expiring_count=expiring_count,
+        expired_count=expired_count,
+        **stats,
     )
 
 
@@ -6,12 +6,19 @@ Handles recipe suggestions, viewing, and CRUD operations.
 
 from flask import Blueprint, render_template, redirect, url_for, flash, request, jsonify
 from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
 
 from app.extensions import db
 from app.models.item import Item
 from app.models.recipe import Recipe, RecipeDraft
 from app.forms.recipes import RecipeForm, RecipeSearchForm, SaveSuggestionForm
-from app.services.recipes import get_ai_adapter, get_rules_engine
+from app.services.recipes import (
+    get_ai_adapter,
+    get_rules_engine,
+    match_items_to_ingredients,
+)
+from app.blueprints.main import invalidate_dashboard_stats
+from app.blueprints._utils import get_owned_or_404
 
 
 recipes_bp = Blueprint('recipes', __name__)
@@ -22,8 +29,10 @@ recipes_bp = Blueprint('recipes', __name__)
 def index():
     """List all saved recipes."""
     form = RecipeSearchForm(request.args, meta={'csrf': False})
-    
-    query = Recipe.query.filter_by(owner_id=current_user.id)
+
+    # List pages read only the model's own columns; fail fast on any
+    # accidental lazy relationship load
+    query = Recipe.query.filter_by(owner_id=current_user.id).options(raiseload('*'))
     
     if form.search.data:
         search_term = f'%{form.search.data}%'
@@ -54,7 +63,8 @@ def new():
             prep_time_minutes=form.prep_time_minutes.data,
             cook_time_minutes=form.cook_time_minutes.data,
         )
-        
+
+        invalidate_dashboard_stats(current_user.id)
         flash(f'Recipe "{recipe.title}" has been saved.', 'success')
         return redirect(url_for('recipes.view', id=recipe.id))
     
@@ -65,7 +75,7 @@ def new():
 @login_required
 def view(id):
     """View a single recipe."""
-    recipe = Recipe.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    recipe = get_owned_or_404(Recipe, id)
     return render_template('recipes/view.html', recipe=recipe)
 
 
@@ -73,7 +83,7 @@ def view(id):
 @login_required
 def edit(id):
     """Edit an existing recipe."""
-    recipe = Recipe.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    recipe = get_owned_or_404(Recipe, id)
     
     form = RecipeForm(obj=recipe)
     
@@ -98,12 +108,13 @@ def edit(id):
 @login_required
 def delete(id):
     """Delete a recipe."""
-    recipe = Recipe.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    recipe = get_owned_or_404(Recipe, id)
     
     title = recipe.title
     db.session.delete(recipe)
     db.session.commit()
-    
+
+    invalidate_dashboard_stats(current_user.id)
     flash(f'Recipe "{title}" has been deleted.', 'success')
     return redirect(url_for('recipes.index'))
 
@@ -114,44 +125,37 @@ def cook(id):
     """
     Cook a recipe - shows matched ingredients and removes them from fridge.
     """
-    recipe = Recipe.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    recipe = get_owned_or_404(Recipe, id)
     
     # Get user's fridge items
     user_items = Item.get_by_owner(current_user.id, include_expired=False)
     
     # Match recipe ingredients to fridge items
-    matched_items = []
-    recipe_ingredients = recipe.ingredients_list
-    
-    for item in user_items:
-        item_name_lower = item.name.lower()
-        for ingredient in recipe_ingredients:
-            ingredient_lower = ingredient.lower()
-            # Check if item name appears in ingredient line
-            if item_name_lower in ingredient_lower or any(
-                word in ingredient_lower 
-                for word in item_name_lower.split()
-                if len(word) > 2
-            ):
-                matched_items.append({
-                    'item': item,
-                    'ingredient_line': ingredient,
-                    'selected': True
-                })
-                break
+    matches = match_items_to_ingredients(
+        [item.name for item in user_items],
+        recipe.ingredients_list,
+    )
+    matched_items = [
+        {'item': item, 'ingredient_line': match[1], 'selected': True}
+        for item, match in zip(user_items, matches)
+        if match is not None
+    ]
     
     if request.method == 'POST':
         # Get selected item IDs to remove
-        items_to_remove = request.form.getlist('remove_items')
-        
+        items_to_remove = [int(item_id) for item_id in request.form.getlist('remove_items')]
+
         removed_count = 0
-        for item_id in items_to_remove:
-            item = Item.query.filter_by(id=int(item_id), owner_id=current_user.id).first()
-            if item:
-                db.session.delete(item)
-                removed_count += 1
-        
+        if items_to_remove:
+            # Single scoped DELETE instead of a SELECT + DELETE per item
+            removed_count = Item.query.filter(
+                Item.owner_id == current_user.id,
+                Item.id.in_(items_to_remove),
+            ).delete(synchronize_session=False)
         db.session.commit()
+
+        if removed_count > 0:
+            invalidate_dashboard_stats(current_user.id)
         
         if removed_count > 0:
             flash(f'Enjoy your {recipe.title}! {removed_count} ingredient(s) removed from your fridge.', 'success')
@@ -230,7 +234,8 @@ def save_suggestion():
         prep_time_minutes=int(prep_time) if prep_time else None,
         cook_time_minutes=int(cook_time) if cook_time else None,
     )
-    
+
+    invalidate_dashboard_stats(current_user.id)
     flash(f'Recipe "{recipe.title}" has been saved!', 'success')
     return redirect(url_for('recipes.view', id=recipe.id))
 
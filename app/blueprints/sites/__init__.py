@@ -4,24 +4,51 @@ Sites blueprint for SmartFridge application.
 Handles CRUD operations for favourite cooking websites.
 """
 
-from flask import Blueprint, render_template, redirect, url_for, flash, request
+from flask import Blueprint, current_app, render_template, redirect, url_for, flash, request
 from flask_login import login_required, current_user
+from sqlalchemy.orm import raiseload
 
 from app.extensions import db
-from app.models.site import Site
+from app.models.site import Site, SiteTag
 from app.forms.sites import SiteForm, SiteSearchForm
+from app.blueprints.main import invalidate_dashboard_stats
+from app.services.cache import TTLCache
+from app.blueprints._utils import get_owned_or_404
 
 
 sites_bp = Blueprint('sites', __name__)
 
+# Per-user cache for the tag dropdown; rebuilding it scans every site
+# row, but tags only change when a site is created, edited or deleted
+_tags_cache = TTLCache()
+
+
+def _get_all_tags(user_id: int) -> list:
+    """Get a user's tag list, cached between site mutations."""
+    # Config-gated like the stats caches; 0 (as in testing) bypasses
+    # the cache entirely so mutations outside this blueprint show up
+    ttl = current_app.config.get('SITE_TAGS_CACHE_SECONDS', 300)
+    if ttl > 0:
+        return _tags_cache.get_or_set(
+            user_id, lambda: Site.get_all_tags(user_id), ttl=ttl
+        )
+    return Site.get_all_tags(user_id)
+
+
+def _invalidate_tags_cache(user_id: int) -> None:
+    """Drop a user's cached tag list after a site mutation."""
+    _tags_cache.delete(user_id)
+
 
 @sites_bp.route('/')
 @login_required
 def index():
     """List all favourite sites."""
     form = SiteSearchForm(request.args, meta={'csrf': False})
-    
-    query = Site.query.filter_by(owner_id=current_user.id)
+
+    # List pages read only the model's own columns; fail fast on any
+    # accidental lazy relationship load
+    query = Site.query.filter_by(owner_id=current_user.id).options(raiseload('*'))
     
     if form.search.data:
         search_term = f'%{form.search.data}%'
@@ -32,13 +59,15 @@ def index():
         )
     
     if form.tag.data:
-        tag_term = f'%{form.tag.data}%'
-        query = query.filter(Site.tags.ilike(tag_term))
+        # Exact match against the normalised tag rows; the dropdown
+        # supplies whole tags, and equality hits the (owner_id, tag)
+        # index where the old ILIKE '%tag%' scanned every row
+        query = query.filter(Site.tag_rows.any(SiteTag.tag == form.tag.data))
     
     sites = query.order_by(Site.title.asc()).all()
     
     # Get all unique tags for filter dropdown
-    all_tags = Site.get_all_tags(current_user.id)
+    all_tags = _get_all_tags(current_user.id)
     
     return render_template('sites/index.html', sites=sites, form=form, all_tags=all_tags)
 
@@ -57,7 +86,9 @@ def new():
             tags=form.tags.data or None,
             description=form.description.data or None,
         )
-        
+
+        invalidate_dashboard_stats(current_user.id)
+        _invalidate_tags_cache(current_user.id)
         flash(f'"{site.title}" has been added to your favourites.', 'success')
         return redirect(url_for('sites.index'))
     
@@ -68,18 +99,19 @@ def new():
 @login_required
 def edit(id):
     """Edit a favourite site."""
-    site = Site.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    site = get_owned_or_404(Site, id)
     
     form = SiteForm(owner_id=current_user.id, site_id=site.id, obj=site)
     
     if form.validate_on_submit():
         site.title = form.title.data
         site.url = form.url.data
-        site.tags = form.tags.data or None
+        site.set_tags_text(form.tags.data)
         site.description = form.description.data or None
         
         db.session.commit()
-        
+
+        _invalidate_tags_cache(current_user.id)
         flash(f'"{site.title}" has been updated.', 'success')
         return redirect(url_for('sites.index'))
     
@@ -90,12 +122,14 @@ def edit(id):
 @login_required
 def delete(id):
     """Delete a favourite site."""
-    site = Site.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    site = get_owned_or_404(Site, id)
     
     title = site.title
     db.session.delete(site)
     db.session.commit()
-    
+
+    invalidate_dashboard_stats(current_user.id)
+    _invalidate_tags_cache(current_user.id)
     flash(f'"{title}" has been removed from your favourites.', 'success')
     return redirect(url_for('sites.index'))
 
@@ -104,7 +138,7 @@ def delete(id):
 @login_required
 def view(id):
     """View site details."""
-    site = Site.query.filter_by(id=id, owner_id=current_user.id).first_or_404()
+    site = get_owned_or_404(Site, id)
     return render_template('sites/view.html', site=site)
 
 
@@ -5,11 +5,56 @@ Supports development, testing, and production environments.
 All sensitive values are loaded from environment variables.
 """
 
+import functools
 import os
+import types
 from datetime import timedelta
 from typing import Dict, Type
 
 
+def _production_database_uri() -> str:
+    """
+    Resolve the production database URI once at import time.
+
+    Handles the postgres:// prefix that Heroku/Azure use, which
+    SQLAlchemy 2.x no longer accepts, normalising it to postgresql://.
+
+    Returns:
+        Database URI string (empty if no environment variable is set).
+    """
+    uri = os.environ.get('SQLALCHEMY_DATABASE_URI') or \
+          os.environ.get('DATABASE_URL', '')  # Azure uses DATABASE_URL
+    if uri.startswith('postgres://'):
+        uri = uri.replace('postgres://', 'postgresql://', 1)
+    return uri
+
+
+# Content Security Policy, built once at import time. Tuples and the
+# mapping proxy keep it immutable, so it can be shared between config
+# objects and serialised to a header string a single time at startup.
+_CSP_POLICY = types.MappingProxyType({
+    'default-src': "'self'",
+    'script-src': (
+        "'self'",
+        'cdn.jsdelivr.net',
+        'cdnjs.cloudflare.com',
+    ),
+    'style-src': (
+        "'self'",
+        "'unsafe-inline'",
+        'cdn.jsdelivr.net',
+        'cdnjs.cloudflare.com',
+    ),
+    'font-src': (
+        "'self'",
+        'cdn.jsdelivr.net',
+        'cdnjs.cloudflare.com',
+    ),
+    'img-src': "'self' data:",
+    'frame-ancestors': "'none'",
+})
+
+
 class Config:
     """Base configuration with defaults."""
     
@@ -37,31 +82,14 @@ class Config:
     # Flask-Talisman (security headers)
     TALISMAN_ENABLED = False
     FORCE_HTTPS = False
-    CSP_POLICY = {
-        'default-src': "'self'",
-        'script-src': [
-            "'self'",
-            'cdn.jsdelivr.net',
-            'cdnjs.cloudflare.com',
-        ],
-        'style-src': [
-            "'self'",
-            "'unsafe-inline'",
-            'cdn.jsdelivr.net',
-            'cdnjs.cloudflare.com',
-        ],
-        'font-src': [
-            "'self'",
-            'cdn.jsdelivr.net',
-            'cdnjs.cloudflare.com',
-        ],
-        'img-src': "'self' data:",
-        'frame-ancestors': "'none'",
-    }
+    CSP_POLICY = _CSP_POLICY
     
-    # Rate limiting
+    # Rate limiting. memory:// storage is per-process; point this at a
+    # shared backend (e.g. redis://host:6379) when running multiple
+    # workers, otherwise each worker keeps its own counters and the
+    # effective limit is multiplied by the worker count.
     RATELIMIT_ENABLED = True
-    RATELIMIT_STORAGE_URL = 'memory://'
+    RATELIMIT_STORAGE_URI = os.environ.get('RATELIMIT_STORAGE_URI', 'memory://')
     RATELIMIT_DEFAULT = '200 per day, 50 per hour'
     RATELIMIT_HEADERS_ENABLED = True
     
@@ -85,6 +113,15 @@ class Config:
     # Application settings
     ITEMS_PER_PAGE = 20
     EXPIRY_WARNING_DAYS = 3
+
+    # Seconds to cache the admin dashboard statistics (0 disables caching)
+    ADMIN_STATS_CACHE_SECONDS = 30
+
+    # Seconds to cache per-user dashboard counts (0 disables caching)
+    DASHBOARD_STATS_CACHE_SECONDS = 60
+
+    # Seconds to cache the per-user site tag dropdown (0 disables caching)
+    SITE_TAGS_CACHE_SECONDS = 300
     
     # Password policy
     PASSWORD_MIN_LENGTH = 8
@@ -123,7 +160,12 @@ class TestingConfig(Config):
     
     # Disable rate limiting for tests
     RATELIMIT_ENABLED = False
-    
+
+    # Disable statistics caching so tests see mutations immediately
+    ADMIN_STATS_CACHE_SECONDS = 0
+    DASHBOARD_STATS_CACHE_SECONDS = 0
+    SITE_TAGS_CACHE_SECONDS = 0
+
     # Faster password hashing for tests
     BCRYPT_WORK_FACTOR = 4
     
@@ -149,20 +191,26 @@ class ProductionConfig(Config):
     TALISMAN_ENABLED = True
     FORCE_HTTPS = True
     
-    # Production database (PostgreSQL)
-    SQLALCHEMY_DATABASE_URI = os.environ.get('SQLALCHEMY_DATABASE_URI') or \
-        os.environ.get('DATABASE_URL')  # Azure uses DATABASE_URL
-    
-    # Fix for Heroku/Azure PostgreSQL URL format
-    @property
-    def SQLALCHEMY_DATABASE_URI(self):
-        uri = os.environ.get('SQLALCHEMY_DATABASE_URI') or \
-              os.environ.get('DATABASE_URL', '')
-        # Handle postgres:// vs postgresql://
-        if uri.startswith('postgres://'):
-            uri = uri.replace('postgres://', 'postgresql://', 1)
-        return uri
-    
+    # Production database (PostgreSQL). Computed once at import: the
+    # previous @property was never triggered by from_object (Flask
+    # reads attributes off the class, yielding the property object
+    # itself) and re-read os.environ on every access.
+    SQLALCHEMY_DATABASE_URI = _production_database_uri()
+
+    # Connection pool sizing. The model helpers commit per call, so a
+    # busy request may check a connection out more than once; sized
+    # pools with overflow stop acquisition queueing under concurrency.
+    # pool_size * worker count must stay under the PostgreSQL
+    # max_connections limit, hence env-tunable moderate defaults.
+    # pool_recycle retires connections before typical idle timeouts on
+    # managed Postgres; pre_ping (inherited default) validates the rest.
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True,
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_recycle': 1800,
+    }
+
     # Production logging
     LOG_LEVEL = 'INFO'
     
@@ -184,3 +232,17 @@ config: Dict[str, Type[Config]] = {
     'production': ProductionConfig,
     'default': DevelopmentConfig,
 }
+
+
+@functools.cache
+def get_config(name: str) -> Type[Config]:
+    """
+    Look up a configuration class by environment name.
+
+    Args:
+        name: Configuration environment name.
+
+    Returns:
+        The matching Config subclass.
+    """
+    return config[name]
@@ -29,9 +29,8 @@ migrate = Migrate()
 # Security headers
 talisman = Talisman()
 
-# Rate limiting
-limiter = Limiter(
-    key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",
-)
+# Rate limiting. Storage backend and default limits come from config
+# (RATELIMIT_STORAGE_URI / RATELIMIT_DEFAULT) at init_app time, so the
+# same counters can be shared across workers via Redis in production
+# instead of being duplicated per process by memory:// storage.
+limiter = Limiter(key_func=get_remote_address)
@@ -1,51 +1,45 @@
 """
 Forms package for SmartFridge application.
+
+Form classes are imported lazily (PEP 562) so that importing
+``app.forms`` does not pull in WTForms and every form module at once.
+Blueprints import from the specific form modules directly; attribute
+access here is only for convenience imports.
 """
 
-from app.forms.auth import (
-    LoginForm,
-    RegistrationForm,
-    ChangePasswordForm,
-    RequestPasswordResetForm,
-    ResetPasswordForm,
-)
-from app.forms.items import ItemForm, ItemSearchForm, BulkDeleteForm
-from app.forms.recipes import (
-    RecipeForm,
-    RecipeSuggestionForm,
-    SaveSuggestionForm,
-    RecipeSearchForm,
-)
-from app.forms.sites import SiteForm, SiteSearchForm
-from app.forms.admin import (
-    UserEditForm,
-    AdminResetPasswordForm,
-    CreateUserForm,
-    UserSearchForm,
-)
+import importlib
 
-__all__ = [
+_FORM_MODULES = {
     # Auth forms
-    'LoginForm',
-    'RegistrationForm',
-    'ChangePasswordForm',
-    'RequestPasswordResetForm',
-    'ResetPasswordForm',
+    'LoginForm': 'app.forms.auth',
+    'RegistrationForm': 'app.forms.auth',
+    'ChangePasswordForm': 'app.forms.auth',
+    'RequestPasswordResetForm': 'app.forms.auth',
+    'ResetPasswordForm': 'app.forms.auth',
     # Item forms
-    'ItemForm',
-    'ItemSearchForm',
-    'BulkDeleteForm',
+    'ItemForm': 'app.forms.items',
+    'ItemSearchForm': 'app.forms.items',
+    'BulkDeleteForm': 'app.forms.items',
     # Recipe forms
-    'RecipeForm',
-    'RecipeSuggestionForm',
-    'SaveSuggestionForm',
-    'RecipeSearchForm',
+    'RecipeForm': 'app.forms.recipes',
+    'RecipeSuggestionForm': 'app.forms.recipes',
+    'SaveSuggestionForm': 'app.forms.recipes',
+    'RecipeSearchForm': 'app.forms.recipes',
     # Site forms
-    'SiteForm',
-    'SiteSearchForm',
+    'SiteForm': 'app.forms.sites',
+    'SiteSearchForm': 'app.forms.sites',
     # Admin forms
-    'UserEditForm',
-    'AdminResetPasswordForm',
-    'CreateUserForm',
-    'UserSearchForm',
-]
+    'UserEditForm': 'app.forms.admin',
+    'AdminResetPasswordForm': 'app.forms.admin',
+    'CreateUserForm': 'app.forms.admin',
+    'UserSearchForm': 'app.forms.admin',
+}
+
+__all__ = list(_FORM_MODULES)
+
+
+def __getattr__(name):
+    """Resolve form attributes on first access."""
+    if name in _FORM_MODULES:
+        return getattr(importlib.import_module(_FORM_MODULES[name]), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
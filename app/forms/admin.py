@@ -3,12 +3,55 @@ Admin forms for SmartFridge application.
 """
 
 from flask_wtf import FlaskForm
+from sqlalchemy import or_
 from wtforms import StringField, PasswordField, SelectField, BooleanField, SubmitField
 from wtforms.validators import DataRequired, Length, Optional, Email, EqualTo, ValidationError
 
+from app.extensions import db
 from app.models.user import User, UserRole
 
 
+# Choice tuples shared across forms, built once at import time; tuples
+# keep them immutable so no form instance can mutate another's choices
+_ROLE_CHOICES = (
+    (UserRole.USER.value, 'User'),
+    (UserRole.ADMIN.value, 'Admin'),
+)
+_ROLE_FILTER_CHOICES = (
+    ('', 'All Roles'),
+    (UserRole.USER.value, 'Users'),
+    (UserRole.ADMIN.value, 'Admins'),
+)
+_STATUS_FILTER_CHOICES = (
+    ('', 'All Statuses'),
+    ('active', 'Active'),
+    ('inactive', 'Inactive'),
+)
+
+
+def _uniqueness_collisions(username, email):
+    """
+    Fetch users matching either a username or an email in one query.
+
+    Args:
+        username: Candidate username (may be falsy).
+        email: Candidate email (may be falsy).
+
+    Returns:
+        List of (id, username, email) rows for any colliding users.
+    """
+    if not username and not email:
+        return []
+    # Compare against the canonical stored form (stripped, lowercased
+    # email) so both predicates stay index-served equality seeks
+    email = email.strip().lower() if email else email
+    return (
+        db.session.query(User.id, User.username, User.email)
+        .filter(or_(User.username == username, User.email == email))
+        .all()
+    )
+
+
 class UserEditForm(FlaskForm):
     """Form for admin to edit user details."""
     
@@ -28,14 +71,8 @@ class UserEditForm(FlaskForm):
         ]
     )
     
-    role = SelectField(
-        'Role',
-        choices=[
-            (UserRole.USER.value, 'User'),
-            (UserRole.ADMIN.value, 'Admin'),
-        ]
-    )
-    
+    role = SelectField('Role', choices=_ROLE_CHOICES)
+
     is_active = BooleanField('Active')
     
     submit = SubmitField('Save Changes')
@@ -49,18 +86,25 @@ class UserEditForm(FlaskForm):
         """
         super().__init__(*args, **kwargs)
         self.user_id = user_id
-    
+        self._collisions = []
+
+    def validate(self, extra_validators=None):
+        """Validate, batching both uniqueness checks into one query."""
+        self._collisions = _uniqueness_collisions(self.username.data, self.email.data)
+        return super().validate(extra_validators)
+
     def validate_username(self, field):
         """Check username is unique."""
-        user = User.get_by_username(field.data)
-        if user and user.id != self.user_id:
-            raise ValidationError('This username is already taken.')
-    
+        for user_id, username, _ in self._collisions:
+            if username == field.data and user_id != self.user_id:
+                raise ValidationError('This username is already taken.')
+
     def validate_email(self, field):
         """Check email is unique."""
-        user = User.get_by_email(field.data)
-        if user and user.id != self.user_id:
-            raise ValidationError('This email is already registered.')
+        candidate = field.data.strip().lower() if field.data else field.data
+        for user_id, _, email in self._collisions:
+            if email == candidate and user_id != self.user_id:
+                raise ValidationError('This email is already registered.')
 
 
 class AdminResetPasswordForm(FlaskForm):
@@ -117,25 +161,24 @@ class CreateUserForm(FlaskForm):
         render_kw={'placeholder': 'Enter password'}
     )
     
-    role = SelectField(
-        'Role',
-        choices=[
-            (UserRole.USER.value, 'User'),
-            (UserRole.ADMIN.value, 'Admin'),
-        ],
-        default=UserRole.USER.value
-    )
-    
+    role = SelectField('Role', choices=_ROLE_CHOICES, default=UserRole.USER.value)
+
     submit = SubmitField('Create User')
-    
+
+    def validate(self, extra_validators=None):
+        """Validate, batching both uniqueness checks into one query."""
+        self._collisions = _uniqueness_collisions(self.username.data, self.email.data)
+        return super().validate(extra_validators)
+
     def validate_username(self, field):
         """Check username is unique."""
-        if User.get_by_username(field.data):
+        if any(username == field.data for _, username, _ in self._collisions):
             raise ValidationError('This username is already taken.')
-    
+
     def validate_email(self, field):
         """Check email is unique."""
-        if User.get_by_email(field.data):
+        candidate = field.data.strip().lower() if field.data else field.data
+        if any(email == candidate for _, _, email in self._collisions):
             raise ValidationError('This email is already registered.')
 
 
@@ -148,24 +191,8 @@ class UserSearchForm(FlaskForm):
         render_kw={'placeholder': 'Search users...'}
     )
     
-    role = SelectField(
-        'Role',
-        choices=[
-            ('', 'All Roles'),
-            (UserRole.USER.value, 'Users'),
-            (UserRole.ADMIN.value, 'Admins'),
-        ],
-        default=''
-    )
-    
-    status = SelectField(
-        'Status',
-        choices=[
-            ('', 'All Statuses'),
-            ('active', 'Active'),
-            ('inactive', 'Inactive'),
-        ],
-        default=''
-    )
+    role = SelectField('Role', choices=_ROLE_FILTER_CHOICES, default='')
+
+    status = SelectField('Status', choices=_STATUS_FILTER_CHOICES, default='')
     
     submit = SubmitField('Filter')
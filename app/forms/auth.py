@@ -2,6 +2,8 @@
 Authentication forms for SmartFridge application.
 """
 
+import re
+
 from flask_wtf import FlaskForm
 from wtforms import StringField, PasswordField, BooleanField, SubmitField
 from wtforms.validators import (
@@ -11,6 +13,36 @@ from wtforms.validators import (
 from app.models.user import User
 
 
+# Precompiled character-class probes; each is a single C-level scan
+# rather than a per-character Python loop
+_HAS_UPPER = re.compile(r'[A-Z]').search
+_HAS_LOWER = re.compile(r'[a-z]').search
+_HAS_DIGIT = re.compile(r'\d').search
+_HAS_SPECIAL = re.compile(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]').search
+
+
+def _password_strength_errors(password: str) -> list:
+    """
+    Check a password against the character-class policy.
+
+    Args:
+        password: Candidate password.
+
+    Returns:
+        List of missing-requirement fragments (empty if all pass).
+    """
+    errors = []
+    if not _HAS_UPPER(password):
+        errors.append('at least one uppercase letter')
+    if not _HAS_LOWER(password):
+        errors.append('at least one lowercase letter')
+    if not _HAS_DIGIT(password):
+        errors.append('at least one digit')
+    if not _HAS_SPECIAL(password):
+        errors.append('at least one special character')
+    return errors
+
+
 class LoginForm(FlaskForm):
     """User login form."""
     
@@ -94,18 +126,7 @@ class RegistrationForm(FlaskForm):
     
     def validate_password(self, field):
         """Validate password strength."""
-        password = field.data
-        errors = []
-        
-        if not any(c.isupper() for c in password):
-            errors.append('at least one uppercase letter')
-        if not any(c.islower() for c in password):
-            errors.append('at least one lowercase letter')
-        if not any(c.isdigit() for c in password):
-            errors.append('at least one digit')
-        if not any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?' for c in password):
-            errors.append('at least one special character')
-        
+        errors = _password_strength_errors(field.data)
         if errors:
             raise ValidationError(f'Password must contain {", ".join(errors)}.')
 
@@ -143,18 +164,7 @@ class ChangePasswordForm(FlaskForm):
     
     def validate_new_password(self, field):
         """Validate password strength."""
-        password = field.data
-        errors = []
-        
-        if not any(c.isupper() for c in password):
-            errors.append('at least one uppercase letter')
-        if not any(c.islower() for c in password):
-            errors.append('at least one lowercase letter')
-        if not any(c.isdigit() for c in password):
-            errors.append('at least one digit')
-        if not any(c in '!@#$%^&*()_+-=[]{}|;:,.<>?' for c in password):
-            errors.append('at least one special character')
-        
+        errors = _password_strength_errors(field.data)
         if errors:
             raise ValidationError(f'Password must contain {", ".join(errors)}.')
 
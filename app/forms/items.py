@@ -10,6 +10,20 @@ from wtforms.validators import DataRequired, Length, Optional
 from app.models.item import ItemCategory
 
 
+# Choice tuples built once at import by iterating the enum; tuples keep
+# them immutable and shared across every form instance
+_CATEGORY_CHOICES = tuple(
+    (category.value, category.name.title()) for category in ItemCategory
+)
+_CATEGORY_CHOICES_WITH_ALL = (('', 'All Categories'),) + _CATEGORY_CHOICES
+_STATUS_CHOICES = (
+    ('', 'All Items'),
+    ('fresh', 'Fresh'),
+    ('expiring', 'Expiring Soon'),
+    ('expired', 'Expired'),
+)
+
+
 class ItemForm(FlaskForm):
     """Form for creating and editing fridge items."""
     
@@ -43,18 +57,7 @@ class ItemForm(FlaskForm):
     
     category = SelectField(
         'Category',
-        choices=[
-            (ItemCategory.DAIRY.value, 'Dairy'),
-            (ItemCategory.MEAT.value, 'Meat'),
-            (ItemCategory.FISH.value, 'Fish'),
-            (ItemCategory.VEGETABLES.value, 'Vegetables'),
-            (ItemCategory.FRUITS.value, 'Fruits'),
-            (ItemCategory.BEVERAGES.value, 'Beverages'),
-            (ItemCategory.CONDIMENTS.value, 'Condiments'),
-            (ItemCategory.LEFTOVERS.value, 'Leftovers'),
-            (ItemCategory.FROZEN.value, 'Frozen'),
-            (ItemCategory.OTHER.value, 'Other'),
-        ],
+        choices=_CATEGORY_CHOICES,
         default=ItemCategory.OTHER.value
     )
     
@@ -102,30 +105,13 @@ class ItemSearchForm(FlaskForm):
     
     category = SelectField(
         'Category',
-        choices=[
-            ('', 'All Categories'),
-            (ItemCategory.DAIRY.value, 'Dairy'),
-            (ItemCategory.MEAT.value, 'Meat'),
-            (ItemCategory.FISH.value, 'Fish'),
-            (ItemCategory.VEGETABLES.value, 'Vegetables'),
-            (ItemCategory.FRUITS.value, 'Fruits'),
-            (ItemCategory.BEVERAGES.value, 'Beverages'),
-            (ItemCategory.CONDIMENTS.value, 'Condiments'),
-            (ItemCategory.LEFTOVERS.value, 'Leftovers'),
-            (ItemCategory.FROZEN.value, 'Frozen'),
-            (ItemCategory.OTHER.value, 'Other'),
-        ],
+        choices=_CATEGORY_CHOICES_WITH_ALL,
         default=''
     )
-    
+
     status = SelectField(
         'Status',
-        choices=[
-            ('', 'All Items'),
-            ('fresh', 'Fresh'),
-            ('expiring', 'Expiring Soon'),
-            ('expired', 'Expired'),
-        ],
+        choices=_STATUS_CHOICES,
         default=''
     )
     
@@ -62,12 +62,24 @@ class SiteForm(FlaskForm):
         super().__init__(*args, **kwargs)
         self.owner_id = owner_id
         self.site_id = site_id
-    
+        # Memoised uniqueness probe: (url checked, result)
+        self._url_check = None
+
     def validate_url(self, field):
         """Check URL is unique for this user."""
-        if self.owner_id:
-            if Site.url_exists(self.owner_id, field.data, exclude_id=self.site_id):
-                raise ValidationError('You have already saved this URL.')
+        if not self.owner_id:
+            return
+        # Repeat validate() calls within a request reuse the probe
+        # result instead of issuing the SELECT again; keying on the URL
+        # (rather than a bare flag) means a changed value re-checks and
+        # a duplicate still errors on every pass.
+        if self._url_check is None or self._url_check[0] != field.data:
+            self._url_check = (
+                field.data,
+                Site.url_exists(self.owner_id, field.data, exclude_id=self.site_id),
+            )
+        if self._url_check[1]:
+            raise ValidationError('You have already saved this URL.')
 
 
 class SiteSearchForm(FlaskForm):
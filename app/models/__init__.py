@@ -7,7 +7,7 @@ Exports all model classes for convenient importing.
 from app.models.user import User, UserRole
 from app.models.item import Item, ItemCategory, ExpiryStatus
 from app.models.recipe import Recipe, RecipeDraft
-from app.models.site import Site
+from app.models.site import Site, SiteTag
 from app.models.team import Team, user_teams
 
 
@@ -20,6 +20,7 @@ __all__ = [
     'Recipe',
     'RecipeDraft',
     'Site',
+    'SiteTag',
     'Team',
     'user_teams',
 ]
@@ -8,11 +8,30 @@ from datetime import datetime, date, timedelta
 from enum import Enum
 from typing import Optional, List
 
-from sqlalchemy import Index
+from flask import g, has_app_context
+from sqlalchemy import Index, case, func, insert
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import load_only
 
 from app.extensions import db
 
 
+def _today() -> date:
+    """
+    Return today's date, cached on ``g`` for the current request.
+
+    Rendering a list of N items consults the clock from several expiry
+    properties per item; caching on the request context turns 3-5xN
+    syscalls into one. Falls back to a direct read outside a context
+    (CLI scripts, tests without an app).
+    """
+    if has_app_context():
+        if 'today' not in g:
+            g.today = date.today()
+        return g.today
+    return date.today()
+
+
 class ItemCategory(str, Enum):
     """Item category enumeration."""
     DAIRY = 'dairy'
@@ -34,6 +53,20 @@ class ExpiryStatus(str, Enum):
     EXPIRED = 'expired'  # Red - past expiry date
 
 
+# Valid enum values, frozen at import for O(1) membership checks on
+# writes that bypass the forms (CLI, barcode lookups)
+_VALID_CATEGORIES = frozenset(category.value for category in ItemCategory)
+_VALID_STATUSES = frozenset(status.value for status in ExpiryStatus)
+
+
+# Built once at import; status_class is hit once per item per render
+_STATUS_CLASSES = {
+    ExpiryStatus.FRESH: 'success',
+    ExpiryStatus.WARNING: 'warning',
+    ExpiryStatus.EXPIRED: 'danger',
+}
+
+
 class Item(db.Model):
     """
     Fridge item model.
@@ -66,30 +99,64 @@ class Item(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
                           nullable=False)
-    
+
+    owner = db.relationship('User', back_populates='items')
+
     def __repr__(self) -> str:
         return f'<Item {self.name} ({self.quantity})>'
     
-    @property
+    @hybrid_property
     def expiry_status(self) -> ExpiryStatus:
         """
         Calculate the expiry status for visual display.
-        
+
+        Computed once per instance per day: list templates read this
+        (directly and via status_class / is_expired / is_expiring_soon)
+        several times per row, so the result is memoised keyed on
+        (expiry_date, today) - an edited date or a date rollover
+        recomputes, repeat reads are a tuple compare.
+
         Returns:
             ExpiryStatus enum value.
         """
+        key = (self.expiry_date, _today())
+        cached = self.__dict__.get('_status_memo')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
         if self.expiry_date is None:
-            return ExpiryStatus.FRESH
-        
-        today = date.today()
-        days_until_expiry = (self.expiry_date - today).days
-        
-        if days_until_expiry < 0:
-            return ExpiryStatus.EXPIRED
-        elif days_until_expiry <= 3:
-            return ExpiryStatus.WARNING
+            status = ExpiryStatus.FRESH
         else:
-            return ExpiryStatus.FRESH
+            days_until_expiry = (self.expiry_date - key[1]).days
+            if days_until_expiry < 0:
+                status = ExpiryStatus.EXPIRED
+            elif days_until_expiry <= 3:
+                status = ExpiryStatus.WARNING
+            else:
+                status = ExpiryStatus.FRESH
+
+        self.__dict__['_status_memo'] = (key, status)
+        return status
+
+    @expiry_status.expression
+    def expiry_status(cls):
+        """
+        SQL form of the status calculation for database-side filtering.
+
+        Thresholds are bound as concrete dates at query-build time
+        rather than via CURRENT_DATE arithmetic, which keeps the
+        expression portable across SQLite and Postgres.
+        """
+        # Half-open bounds ([today, today+4) for WARNING) so this
+        # expression and get_expiring_soon share the same range shape
+        today = _today()
+        threshold = today + timedelta(days=4)
+        return case(
+            (cls.expiry_date.is_(None), ExpiryStatus.FRESH.value),
+            (cls.expiry_date < today, ExpiryStatus.EXPIRED.value),
+            (cls.expiry_date < threshold, ExpiryStatus.WARNING.value),
+            else_=ExpiryStatus.FRESH.value,
+        )
     
     @property
     def days_until_expiry(self) -> Optional[int]:
@@ -102,7 +169,7 @@ class Item(db.Model):
         """
         if self.expiry_date is None:
             return None
-        return (self.expiry_date - date.today()).days
+        return (self.expiry_date - _today()).days
     
     @property
     def is_expired(self) -> bool:
@@ -122,101 +189,190 @@ class Item(db.Model):
         Returns:
             CSS class name (success, warning, danger).
         """
-        status_classes = {
-            ExpiryStatus.FRESH: 'success',
-            ExpiryStatus.WARNING: 'warning',
-            ExpiryStatus.EXPIRED: 'danger',
-        }
-        return status_classes.get(self.expiry_status, 'secondary')
+        return _STATUS_CLASSES.get(self.expiry_status, 'secondary')
     
     @classmethod
-    def get_by_owner(cls, owner_id: int, include_expired: bool = True) -> List['Item']:
+    def _list_columns(cls):
+        """
+        Loader option projecting only the columns list views display.
+
+        Defers notes, barcode, brand and the timestamps; they lazy-load
+        if a caller does touch them, so edit/detail paths still work.
+        """
+        return load_only(
+            cls.id, cls.name, cls.quantity, cls.category, cls.expiry_date
+        )
+
+    @classmethod
+    def get_by_owner(cls, owner_id: int, include_expired: bool = True,
+                     page: Optional[int] = None, per_page: int = 50):
         """
         Get all items for a user.
-        
+
         Args:
             owner_id: User ID.
             include_expired: Whether to include expired items.
-        
+            page: Page number; when given, a Pagination object is
+                returned instead of materialising every row.
+            per_page: Rows per page when paginating.
+
         Returns:
-            List of Item instances.
+            List of Item instances, or a Pagination when page is given.
         """
-        query = cls.query.filter_by(owner_id=owner_id)
+        query = cls.query.options(cls._list_columns()).filter_by(owner_id=owner_id)
         if not include_expired:
             query = query.filter(
-                (cls.expiry_date >= date.today()) | (cls.expiry_date.is_(None))
+                (cls.expiry_date >= _today()) | (cls.expiry_date.is_(None))
             )
-        return query.order_by(cls.expiry_date.asc().nullslast()).all()
+        query = query.order_by(cls.expiry_date.asc().nullslast())
+        if page is not None:
+            return query.paginate(page=page, per_page=per_page, error_out=False)
+        return query.all()
     
     @classmethod
-    def get_expiring_soon(cls, owner_id: int, days: int = 3) -> List['Item']:
+    def get_expiring_soon(cls, owner_id: int, days: int = 3,
+                          limit: Optional[int] = None) -> List['Item']:
         """
         Get items expiring within specified days.
-        
+
         Args:
             owner_id: User ID.
             days: Number of days to look ahead.
-        
+            limit: Maximum number of rows to fetch (None for all).
+
         Returns:
             List of Item instances expiring soon.
         """
-        threshold = date.today() + timedelta(days=days)
-        return cls.query.filter(
+        # Half-open range: [today, today + days + 1) is one contiguous
+        # scan of the (owner_id, expiry_date) index and matches the
+        # WARNING branch of the expiry_status SQL expression exactly
+        today = _today()
+        threshold = today + timedelta(days=days + 1)
+        query = cls.query.options(cls._list_columns()).filter(
             cls.owner_id == owner_id,
-            cls.expiry_date <= threshold,
-            cls.expiry_date >= date.today()
-        ).order_by(cls.expiry_date.asc()).all()
-    
+            cls.expiry_date >= today,
+            cls.expiry_date < threshold
+        ).order_by(cls.expiry_date.asc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
     @classmethod
-    def get_expired(cls, owner_id: int) -> List['Item']:
+    def get_expired(cls, owner_id: int,
+                    limit: Optional[int] = None) -> List['Item']:
         """
         Get expired items for a user.
-        
+
         Args:
             owner_id: User ID.
-        
+            limit: Maximum number of rows to fetch (None for all).
+
         Returns:
             List of expired Item instances.
         """
-        return cls.query.filter(
+        query = cls.query.options(cls._list_columns()).filter(
             cls.owner_id == owner_id,
-            cls.expiry_date < date.today()
-        ).order_by(cls.expiry_date.desc()).all()
+            cls.expiry_date < _today()
+        ).order_by(cls.expiry_date.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @classmethod
+    def get_expiry_counts(cls, owner_id: int, days: int = 3) -> tuple:
+        """
+        Count a user's expiring and expired items in one query.
+
+        Uses conditional aggregation over the (owner_id, expiry_date)
+        index so both totals come back in a single pass.
+
+        Args:
+            owner_id: User ID.
+            days: Number of days to look ahead for "expiring soon".
+
+        Returns:
+            Tuple of (expiring_count, expired_count).
+        """
+        today = _today()
+        threshold = today + timedelta(days=days + 1)
+        expiring, expired = db.session.query(
+            func.coalesce(func.sum(case(
+                ((cls.expiry_date >= today) & (cls.expiry_date < threshold), 1),
+                else_=0,
+            )), 0),
+            func.coalesce(func.sum(case(
+                (cls.expiry_date < today, 1),
+                else_=0,
+            )), 0),
+        ).filter(cls.owner_id == owner_id).one()
+        return expiring, expired
     
     @classmethod
-    def get_by_category(cls, owner_id: int, category: str) -> List['Item']:
+    def get_by_status(cls, owner_id: int, status: 'ExpiryStatus') -> List['Item']:
+        """
+        Get items with a given expiry status, filtered in the database.
+
+        Args:
+            owner_id: User ID.
+            status: ExpiryStatus to filter by.
+
+        Returns:
+            List of Item instances with that status.
+        """
+        return cls.query.filter(
+            cls.owner_id == owner_id,
+            cls.expiry_status == status
+        ).order_by(cls.expiry_date.asc().nullslast()).all()
+
+    @classmethod
+    def get_by_category(cls, owner_id: int, category: str,
+                        page: Optional[int] = None, per_page: int = 50):
         """
         Get items by category.
-        
+
         Args:
             owner_id: User ID.
             category: Category to filter by.
-        
+            page: Page number; when given, a Pagination object is
+                returned instead of the full list.
+            per_page: Rows per page when paginating.
+
         Returns:
-            List of Item instances in the category.
+            List of Item instances, or a Pagination when page is given.
         """
-        return cls.query.filter_by(
+        query = cls.query.options(cls._list_columns()).filter_by(
             owner_id=owner_id,
             category=category
-        ).order_by(cls.expiry_date.asc().nullslast()).all()
-    
+        ).order_by(cls.expiry_date.asc().nullslast())
+        if page is not None:
+            return query.paginate(page=page, per_page=per_page, error_out=False)
+        return query.all()
+
     @classmethod
-    def search(cls, owner_id: int, query: str) -> List['Item']:
+    def search(cls, owner_id: int, query: str,
+               page: Optional[int] = None, per_page: int = 50):
         """
         Search items by name.
-        
+
         Args:
             owner_id: User ID.
             query: Search term.
-        
+            page: Page number; when given, a Pagination object is
+                returned instead of the full list.
+            per_page: Rows per page when paginating.
+
         Returns:
-            List of matching Item instances.
+            List of matching Item instances, or a Pagination when page
+            is given.
         """
         search_term = f'%{query}%'
-        return cls.query.filter(
+        matches = cls.query.options(cls._list_columns()).filter(
             cls.owner_id == owner_id,
             cls.name.ilike(search_term)
-        ).order_by(cls.name.asc()).all()
+        ).order_by(cls.name.asc())
+        if page is not None:
+            return matches.paginate(page=page, per_page=per_page, error_out=False)
+        return matches.all()
     
     @classmethod
     def create(cls, owner_id: int, name: str, quantity: str = '1',
@@ -240,7 +396,12 @@ class Item(db.Model):
         
         Returns:
             Created Item instance.
+
+        Raises:
+            ValueError: If category is not a valid ItemCategory value.
         """
+        if category not in _VALID_CATEGORIES:
+            raise ValueError(f'Invalid item category: {category!r}')
         item = cls(
             owner_id=owner_id,
             name=name,
@@ -254,7 +415,40 @@ class Item(db.Model):
         db.session.add(item)
         db.session.commit()
         return item
-    
+
+    @classmethod
+    def create_many(cls, owner_id: int, rows: List[dict]) -> List[int]:
+        """
+        Create many items for a user in one INSERT.
+
+        A single multi-row Core insert replaces the round trip and
+        commit per item that looping Item.create would cost; column
+        defaults (quantity, category, timestamps) still apply.
+
+        Args:
+            owner_id: User ID.
+            rows: List of column dicts (name, quantity, category, ...).
+
+        Returns:
+            List of created item ids, in input order.
+
+        Raises:
+            ValueError: If a row carries an invalid category value.
+        """
+        if not rows:
+            return []
+        for row in rows:
+            if row.get('category', ItemCategory.OTHER.value) not in _VALID_CATEGORIES:
+                raise ValueError(f"Invalid item category: {row['category']!r}")
+        values = [{'owner_id': owner_id, **row} for row in rows]
+        ids = db.session.execute(
+            insert(cls.__table__)
+            .values(values)
+            .returning(cls.__table__.c.id)
+        ).scalars().all()
+        db.session.commit()
+        return ids
+
     @classmethod
     def get_by_barcode(cls, owner_id: int, barcode: str) -> Optional['Item']:
         """
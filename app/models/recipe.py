@@ -7,16 +7,35 @@ Stores user-saved recipes, including AI-generated suggestions.
 from datetime import datetime
 from typing import Optional, List
 
+from sqlalchemy import insert
+from werkzeug.utils import cached_property
+
 from app.extensions import db
 
 
+def _split_lines(text: Optional[str]) -> List[str]:
+    """
+    Split a text block into stripped, non-empty lines.
+
+    Args:
+        text: Multi-line text (may be None or empty).
+
+    Returns:
+        List of line strings.
+    """
+    if not text:
+        return []
+    return [line.strip() for line in text.strip().split('\n') if line.strip()]
+
+
 class Recipe(db.Model):
     """
     Recipe model.
     
     Attributes:
         id: Primary key.
-        owner_id: Foreign key to User.
+        owner_id: Foreign key to User; NULL marks a public (seeded)
+            recipe owned by nobody.
         title: Recipe title.
         ingredients_text: Ingredients list (plain text).
         instructions: Cooking instructions.
@@ -29,7 +48,7 @@ class Recipe(db.Model):
     __tablename__ = 'recipes'
     
     id = db.Column(db.Integer, primary_key=True)
-    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True, index=True)
     title = db.Column(db.String(200), nullable=False)
     ingredients_text = db.Column(db.Text, nullable=False)
     instructions = db.Column(db.Text, nullable=False)
@@ -41,7 +60,9 @@ class Recipe(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow,
                           nullable=False)
-    
+
+    owner = db.relationship('User', back_populates='recipes')
+
     def __repr__(self) -> str:
         return f'<Recipe {self.title}>'
     
@@ -52,69 +73,76 @@ class Recipe(db.Model):
             return self.prep_time_minutes + self.cook_time_minutes
         return self.prep_time_minutes or self.cook_time_minutes
     
-    @property
+    @cached_property
     def ingredients_list(self) -> List[str]:
         """
-        Parse ingredients text into a list.
-        
+        Parse ingredients text into a list, cached per instance.
+
+        Templates iterate, count and preview this repeatedly; caching
+        avoids re-splitting the full text on each access.
+
         Returns:
             List of ingredient strings.
         """
-        if not self.ingredients_text:
-            return []
-        return [
-            line.strip()
-            for line in self.ingredients_text.strip().split('\n')
-            if line.strip()
-        ]
-    
-    @property
+        return _split_lines(self.ingredients_text)
+
+    @cached_property
     def instructions_list(self) -> List[str]:
         """
-        Parse instructions into numbered steps.
-        
+        Parse instructions into numbered steps, cached per instance.
+
         Returns:
             List of instruction strings.
         """
-        if not self.instructions:
-            return []
-        return [
-            line.strip()
-            for line in self.instructions.strip().split('\n')
-            if line.strip()
-        ]
+        return _split_lines(self.instructions)
     
     @classmethod
-    def get_by_owner(cls, owner_id: int) -> List['Recipe']:
+    def get_by_owner(cls, owner_id: int,
+                     page: Optional[int] = None, per_page: int = 50):
         """
         Get all recipes for a user.
-        
+
         Args:
             owner_id: User ID.
-        
+            page: Page number; when given, a Pagination object is
+                returned instead of materialising every row.
+            per_page: Rows per page when paginating.
+
         Returns:
-            List of Recipe instances.
+            List of Recipe instances, or a Pagination when page is
+            given.
         """
-        return cls.query.filter_by(owner_id=owner_id)\
-            .order_by(cls.created_at.desc()).all()
-    
+        query = cls.query.filter_by(owner_id=owner_id)\
+            .order_by(cls.created_at.desc())
+        if page is not None:
+            return query.paginate(page=page, per_page=per_page, error_out=False)
+        return query.all()
+
     @classmethod
-    def search(cls, owner_id: int, query: str) -> List['Recipe']:
+    def search(cls, owner_id: int, query: str,
+               page: Optional[int] = None, per_page: int = 50):
         """
         Search recipes by title or ingredients.
-        
+
         Args:
             owner_id: User ID.
             query: Search term.
-        
+            page: Page number; when given, a Pagination object is
+                returned instead of the full list.
+            per_page: Rows per page when paginating.
+
         Returns:
-            List of matching Recipe instances.
+            List of matching Recipe instances, or a Pagination when
+            page is given.
         """
         search_term = f'%{query}%'
-        return cls.query.filter(
+        matches = cls.query.filter(
             cls.owner_id == owner_id,
             (cls.title.ilike(search_term) | cls.ingredients_text.ilike(search_term))
-        ).order_by(cls.title.asc()).all()
+        ).order_by(cls.title.asc())
+        if page is not None:
+            return matches.paginate(page=page, per_page=per_page, error_out=False)
+        return matches.all()
     
     @classmethod
     def create(cls, owner_id: int, title: str, ingredients_text: str,
@@ -154,6 +182,33 @@ class Recipe(db.Model):
         db.session.commit()
         return recipe
 
+    @classmethod
+    def create_many(cls, owner_id: int, rows: List[dict]) -> List[int]:
+        """
+        Create many recipes for a user in one INSERT.
+
+        A single multi-row Core insert replaces the round trip and
+        commit per recipe that looping Recipe.create would cost; column
+        defaults (is_ai_generated, timestamps) still apply.
+
+        Args:
+            owner_id: User ID.
+            rows: List of column dicts (title, ingredients_text, ...).
+
+        Returns:
+            List of created recipe ids, in input order.
+        """
+        if not rows:
+            return []
+        values = [{'owner_id': owner_id, **row} for row in rows]
+        ids = db.session.execute(
+            insert(cls.__table__)
+            .values(values)
+            .returning(cls.__table__.c.id)
+        ).scalars().all()
+        db.session.commit()
+        return ids
+
 
 class RecipeDraft:
     """
@@ -161,7 +216,21 @@ class RecipeDraft:
     
     Used by AI adapter to return recipe suggestions before saving.
     """
-    
+
+    # Slots: suggestion requests build batches of these, and skipping
+    # the per-instance __dict__ trims memory and attribute lookups
+    __slots__ = (
+        'title',
+        'ingredients_text',
+        'instructions',
+        'source_url',
+        'servings',
+        'prep_time_minutes',
+        'cook_time_minutes',
+        'match_score',
+        'missing_ingredients',
+    )
+
     def __init__(
         self,
         title: str,
@@ -186,17 +255,9 @@ class RecipeDraft:
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialisation."""
-        return {
-            'title': self.title,
-            'ingredients_text': self.ingredients_text,
-            'instructions': self.instructions,
-            'source_url': self.source_url,
-            'servings': self.servings,
-            'prep_time_minutes': self.prep_time_minutes,
-            'cook_time_minutes': self.cook_time_minutes,
-            'match_score': self.match_score,
-            'missing_ingredients': self.missing_ingredients,
-        }
+        # __slots__ doubles as the field list, so new attributes are
+        # serialised without touching this method
+        return {field: getattr(self, field) for field in self.__slots__}
     
     @classmethod
     def from_dict(cls, data: dict) -> 'RecipeDraft':
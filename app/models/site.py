@@ -7,11 +7,44 @@ Stores favourite cooking websites.
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import Index, UniqueConstraint
 
 from app.extensions import db
 
 
+class SiteTag(db.Model):
+    """
+    One tag on one site, normalised out of the comma-separated column.
+
+    Tag lookups against the string column need ILIKE '%tag%', which
+    scans every row and matches substrings ("milk" finds "buttermilk");
+    equality against these rows is served by a btree index instead.
+    owner_id is denormalised so per-user tag queries skip the join.
+
+    Attributes:
+        id: Primary key.
+        site_id: Foreign key to Site.
+        owner_id: Foreign key to User (denormalised for indexing).
+        tag: Single tag string.
+    """
+
+    __tablename__ = 'site_tags'
+
+    id = db.Column(db.Integer, primary_key=True)
+    site_id = db.Column(db.Integer, db.ForeignKey('sites.id'), nullable=False, index=True)
+    owner_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    tag = db.Column(db.String(64), nullable=False)
+
+    __table_args__ = (
+        Index('idx_site_tags_owner_tag', 'owner_id', 'tag'),
+    )
+
+    site = db.relationship('Site', back_populates='tag_rows')
+
+    def __repr__(self) -> str:
+        return f'<SiteTag {self.tag}>'
+
+
 class Site(db.Model):
     """
     Favourite cooking website model.
@@ -36,48 +69,80 @@ class Site(db.Model):
     description = db.Column(db.Text, nullable=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     
-    # Unique constraint: same URL per user
+    # Unique constraint plus the (owner_id, title) index serving the
+    # get_by_owner filter-and-sort in one scan
     __table_args__ = (
         UniqueConstraint('owner_id', 'url', name='uq_site_owner_url'),
+        Index('idx_sites_owner_title', 'owner_id', 'title'),
     )
-    
+
+    owner = db.relationship('User', back_populates='sites')
+
+    # Normalised tag rows, kept in sync with the tags string by
+    # set_tags/set_tags_text; delete-orphan lets replacement and site
+    # deletion clean up without raw DELETEs
+    tag_rows = db.relationship('SiteTag', back_populates='site',
+                               cascade='all, delete-orphan', lazy='selectin')
+
     def __repr__(self) -> str:
         return f'<Site {self.title}>'
-    
+
     @property
     def tags_list(self) -> List[str]:
         """
         Parse tags string into a list.
-        
+
         Returns:
             List of tag strings.
         """
         if not self.tags:
             return []
         return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
-    
+
     def set_tags(self, tags: List[str]) -> None:
         """
         Set tags from a list.
-        
+
         Args:
             tags: List of tag strings.
         """
-        self.tags = ', '.join(tag.strip() for tag in tags if tag.strip())
+        self.set_tags_text(', '.join(tag.strip() for tag in tags if tag.strip()))
+
+    def set_tags_text(self, tags: Optional[str]) -> None:
+        """
+        Set the comma-separated tags string and sync the tag rows.
+
+        All writers must go through here (or set_tags) so the
+        site_tags rows stay consistent with the display string.
+
+        Args:
+            tags: Comma-separated tags, or None to clear.
+        """
+        self.tags = tags or None
+        self.tag_rows = [
+            SiteTag(owner_id=self.owner_id, tag=tag) for tag in self.tags_list
+        ]
     
     @classmethod
-    def get_by_owner(cls, owner_id: int) -> List['Site']:
+    def get_by_owner(cls, owner_id: int,
+                     page: Optional[int] = None, per_page: int = 50):
         """
         Get all sites for a user.
-        
+
         Args:
             owner_id: User ID.
-        
+            page: Page number; when given, a Pagination object is
+                returned instead of materialising every row.
+            per_page: Rows per page when paginating.
+
         Returns:
-            List of Site instances.
+            List of Site instances, or a Pagination when page is given.
         """
-        return cls.query.filter_by(owner_id=owner_id)\
-            .order_by(cls.title.asc()).all()
+        query = cls.query.filter_by(owner_id=owner_id)\
+            .order_by(cls.title.asc())
+        if page is not None:
+            return query.paginate(page=page, per_page=per_page, error_out=False)
+        return query.all()
     
     @classmethod
     def get_by_tag(cls, owner_id: int, tag: str) -> List['Site']:
@@ -91,31 +156,41 @@ class Site(db.Model):
         Returns:
             List of Site instances with the tag.
         """
-        search_pattern = f'%{tag}%'
+        # Equality over the (owner_id, tag) index replaces the old
+        # ILIKE '%tag%' scan, which also substring-matched ("milk"
+        # found "buttermilk")
         return cls.query.filter(
             cls.owner_id == owner_id,
-            cls.tags.ilike(search_pattern)
+            cls.tag_rows.any(SiteTag.tag == tag)
         ).order_by(cls.title.asc()).all()
     
     @classmethod
-    def search(cls, owner_id: int, query: str) -> List['Site']:
+    def search(cls, owner_id: int, query: str,
+               page: Optional[int] = None, per_page: int = 50):
         """
         Search sites by title, URL, or tags.
-        
+
         Args:
             owner_id: User ID.
             query: Search term.
-        
+            page: Page number; when given, a Pagination object is
+                returned instead of the full list.
+            per_page: Rows per page when paginating.
+
         Returns:
-            List of matching Site instances.
+            List of matching Site instances, or a Pagination when page
+            is given.
         """
         search_term = f'%{query}%'
-        return cls.query.filter(
+        matches = cls.query.filter(
             cls.owner_id == owner_id,
             (cls.title.ilike(search_term) |
              cls.url.ilike(search_term) |
              cls.tags.ilike(search_term))
-        ).order_by(cls.title.asc()).all()
+        ).order_by(cls.title.asc())
+        if page is not None:
+            return matches.paginate(page=page, per_page=per_page, error_out=False)
+        return matches.all()
     
     @classmethod
     def get_all_tags(cls, owner_id: int) -> List[str]:
@@ -128,11 +203,12 @@ class Site(db.Model):
         Returns:
             List of unique tag strings.
         """
-        sites = cls.query.filter_by(owner_id=owner_id).all()
-        tags = set()
-        for site in sites:
-            tags.update(site.tags_list)
-        return sorted(tags)
+        # DISTINCT over the (owner_id, tag) index; no string splitting
+        # and no Site rows fetched at all
+        rows = db.session.query(SiteTag.tag).filter(
+            SiteTag.owner_id == owner_id
+        ).distinct().order_by(SiteTag.tag.asc()).all()
+        return [tag for (tag,) in rows]
     
     @classmethod
     def url_exists(cls, owner_id: int, url: str, exclude_id: Optional[int] = None) -> bool:
@@ -150,7 +226,10 @@ class Site(db.Model):
         query = cls.query.filter_by(owner_id=owner_id, url=url)
         if exclude_id:
             query = query.filter(cls.id != exclude_id)
-        return query.first() is not None
+        # EXISTS stops at the first match and returns a bare boolean;
+        # .first() would fetch and hydrate a full row. The probe is
+        # served by the uq_site_owner_url unique index.
+        return db.session.query(query.exists()).scalar()
     
     @classmethod
     def create(cls, owner_id: int, title: str, url: str,
@@ -173,9 +252,9 @@ class Site(db.Model):
             owner_id=owner_id,
             title=title,
             url=url,
-            tags=tags,
             description=description,
         )
+        site.set_tags_text(tags)
         db.session.add(site)
         db.session.commit()
         return site
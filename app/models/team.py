@@ -5,7 +5,10 @@ Allows users to share fridge items within a team/family group.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from werkzeug.utils import cached_property
 
 from app.extensions import db
 
@@ -45,22 +48,43 @@ class Team(db.Model):
         'User',
         secondary=user_teams,
         lazy='dynamic',
-        backref=db.backref('teams', lazy='dynamic')
+        back_populates='teams'
     )
     creator = db.relationship('User', foreign_keys=[created_by])
     
     def __repr__(self) -> str:
         return f'<Team {self.name}>'
     
+    @cached_property
+    def _role_map(self) -> Dict[int, str]:
+        """
+        Map of member user ID to role, fetched once per instance.
+
+        is_member, get_member_role and member_count each issued their
+        own SELECT; loops over those checks were N+1. One query over
+        the association table feeds them all; add_member/remove_member
+        invalidate the memo.
+        """
+        rows = db.session.execute(
+            select(user_teams.c.user_id, user_teams.c.role).where(
+                user_teams.c.team_id == self.id
+            )
+        ).all()
+        return dict(rows)
+
+    def _invalidate_role_map(self) -> None:
+        """Drop the memoised role map after a membership change."""
+        self.__dict__.pop('_role_map', None)
+
     @property
     def member_count(self) -> int:
         """Get number of team members."""
-        return self.members.count()
-    
+        return len(self._role_map)
+
     def add_member(self, user, role: str = 'member') -> None:
         """
         Add a user to the team.
-        
+
         Args:
             user: User instance to add.
             role: Member role (owner, admin, member).
@@ -74,11 +98,12 @@ class Team(db.Model):
             )
             db.session.execute(stmt)
             db.session.commit()
-    
+            self._invalidate_role_map()
+
     def remove_member(self, user) -> None:
         """
         Remove a user from the team.
-        
+
         Args:
             user: User instance to remove.
         """
@@ -89,36 +114,31 @@ class Team(db.Model):
             )
             db.session.execute(stmt)
             db.session.commit()
-    
+            self._invalidate_role_map()
+
     def is_member(self, user) -> bool:
         """
         Check if user is a team member.
-        
+
         Args:
             user: User instance to check.
-        
+
         Returns:
             True if member, False otherwise.
         """
-        return self.members.filter_by(id=user.id).first() is not None
-    
+        return user.id in self._role_map
+
     def get_member_role(self, user) -> Optional[str]:
         """
         Get a user's role in the team.
-        
+
         Args:
             user: User instance.
-        
+
         Returns:
             Role string or None if not a member.
         """
-        result = db.session.execute(
-            user_teams.select().where(
-                (user_teams.c.user_id == user.id) &
-                (user_teams.c.team_id == self.id)
-            )
-        ).first()
-        return result.role if result else None
+        return self._role_map.get(user.id)
     
     @classmethod
     def get_user_teams(cls, user_id: int) -> List['Team']:
@@ -150,7 +170,7 @@ class Team(db.Model):
             Created Team instance.
         """
         import secrets
-        
+
         team = cls(
             name=name,
             created_by=created_by,
@@ -158,12 +178,17 @@ class Team(db.Model):
             invite_code=secrets.token_urlsafe(16),
         )
         db.session.add(team)
+        # One transaction: flush assigns team.id, the owner membership
+        # row goes in directly, and a single commit covers both. The
+        # old path committed the team, fetched the creator and ran the
+        # is_member probe inside add_member before committing again -
+        # three round-trips plus two SELECTs for a brand-new team
+        db.session.flush()
+        db.session.execute(user_teams.insert().values(
+            user_id=created_by,
+            team_id=team.id,
+            role='owner',
+        ))
         db.session.commit()
-        
-        # Add creator as owner
-        from app.models.user import User
-        creator = User.query.get(created_by)
-        if creator:
-            team.add_member(creator, role='owner')
-        
+
         return team
@@ -9,7 +9,8 @@ from enum import Enum
 from typing import Optional
 
 from flask_login import UserMixin
-from sqlalchemy import Index
+from sqlalchemy import Index, text
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.extensions import db
 from app.services.security.password import PasswordService
@@ -48,13 +49,19 @@ class User(UserMixin, db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     last_login = db.Column(db.DateTime, nullable=True)
     
-    # Relationships
-    items = db.relationship('Item', backref='owner', lazy='dynamic',
+    # Relationships. lazy='selectin' loads each collection with one
+    # batched SELECT on first access; nothing filters these on the
+    # relationship, so the old lazy='dynamic' only added a query per
+    # attribute access. Both sides are declared explicitly
+    # (back_populates) so each can pick its own loader strategy.
+    items = db.relationship('Item', back_populates='owner', lazy='selectin',
                            cascade='all, delete-orphan')
-    recipes = db.relationship('Recipe', backref='owner', lazy='dynamic',
+    recipes = db.relationship('Recipe', back_populates='owner', lazy='selectin',
                              cascade='all, delete-orphan')
-    sites = db.relationship('Site', backref='owner', lazy='dynamic',
+    sites = db.relationship('Site', back_populates='owner', lazy='selectin',
                            cascade='all, delete-orphan')
+    teams = db.relationship('Team', secondary='user_teams',
+                            back_populates='members', lazy='selectin')
     
     def __repr__(self) -> str:
         return f'<User {self.username}>'
@@ -86,9 +93,25 @@ class User(UserMixin, db.Model):
         return self.role == UserRole.ADMIN.value
     
     def update_last_login(self) -> None:
-        """Update the last login timestamp."""
-        self.last_login = datetime.utcnow()
+        """
+        Update the last login timestamp.
+
+        Issues a single UPDATE rather than flushing the whole ORM object,
+        keeping the write out of the login request's critical path.
+        On PostgreSQL the commit additionally skips the WAL flush wait:
+        losing a last_login timestamp in a crash is harmless, so the
+        login response need not sit behind an fsync.
+        """
+        now = datetime.utcnow()
+        if db.engine.dialect.name == 'postgresql':
+            # SET LOCAL scopes the relaxation to this one transaction
+            db.session.execute(text('SET LOCAL synchronous_commit = OFF'))
+        type(self).query.filter_by(id=self.id).update(
+            {'last_login': now}, synchronize_session=False
+        )
         db.session.commit()
+        # Reflect the new value on the instance without re-dirtying it
+        set_committed_value(self, 'last_login', now)
     
     def deactivate(self) -> None:
         """Deactivate the user account."""
@@ -109,16 +132,76 @@ class User(UserMixin, db.Model):
         """Reject the user account (admin rejection for registration)."""
         db.session.delete(self)
         db.session.commit()
-    
+
+    @classmethod
+    def reject_many(cls, user_ids: list) -> int:
+        """
+        Reject several pending registrations in one statement.
+
+        Looping user.reject() loads each row and issues a DELETE plus
+        commit per user; this deletes them all with one statement and
+        one commit. Only unapproved accounts are touched - pending
+        registrations have never logged in, so they own no items,
+        recipes or sites and the ORM delete cascades have nothing to do.
+
+        Args:
+            user_ids: IDs of the users to reject.
+
+        Returns:
+            Number of accounts deleted.
+        """
+        if not user_ids:
+            return 0
+        deleted = db.session.query(cls).filter(
+            cls.id.in_(user_ids),
+            cls.is_approved.is_(False)
+        ).delete(synchronize_session=False)
+        db.session.commit()
+        return deleted
+
     @property
     def is_pending_approval(self) -> bool:
         """Check if user is pending admin approval."""
         return not self.is_approved
     
     @classmethod
-    def get_pending_users(cls) -> list:
-        """Get all users pending approval."""
-        return cls.query.filter_by(is_approved=False).order_by(cls.created_at.asc()).all()
+    def has_other_admin(cls, exclude_id: int, active_only: bool = False) -> bool:
+        """
+        Check whether any admin other than the given user exists.
+
+        Uses an EXISTS query so the database can stop at the first
+        matching row instead of counting all admins.
+
+        Args:
+            exclude_id: User ID to exclude from the check.
+            active_only: Only consider active admin accounts.
+
+        Returns:
+            True if another admin exists, False otherwise.
+        """
+        query = cls.query.filter(
+            cls.role == UserRole.ADMIN.value,
+            cls.id != exclude_id,
+        )
+        if active_only:
+            query = query.filter(cls.is_active.is_(True))
+        return db.session.query(query.exists()).scalar()
+
+    @classmethod
+    def get_pending_users(cls, limit: Optional[int] = None) -> list:
+        """
+        Get users pending approval, oldest registration first.
+
+        Args:
+            limit: Maximum number of rows to fetch (None for all).
+
+        Returns:
+            List of pending User instances.
+        """
+        query = cls.query.filter_by(is_approved=False).order_by(cls.created_at.asc())
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
     
     @classmethod
     def get_by_username(cls, username: str) -> Optional['User']:
@@ -144,7 +227,10 @@ class User(UserMixin, db.Model):
         Returns:
             User instance or None.
         """
-        return cls.query.filter_by(email=email.lower()).first()
+        # Emails are stored canonically (stripped, lowercased), so this
+        # stays a plain equality seek on the existing unique index
+        # rather than a LOWER(email) scan
+        return cls.query.filter_by(email=email.strip().lower()).first()
     
     @classmethod
     def create(cls, username: str, email: str, password: str,
@@ -164,7 +250,7 @@ class User(UserMixin, db.Model):
         """
         user = cls(
             username=username,
-            email=email.lower(),
+            email=email.strip().lower(),
             role=role.value if isinstance(role, UserRole) else role,
             is_approved=is_approved,
         )
@@ -177,3 +263,5 @@ class User(UserMixin, db.Model):
 # Indexes for common queries
 Index('idx_users_username_active', User.username, User.is_active)
 Index('idx_users_email_active', User.email, User.is_active)
+Index('idx_users_created_at', User.created_at)
+Index('idx_users_role_active', User.role, User.is_active)
@@ -12,6 +12,31 @@ import httpx
 from flask import current_app
 
 from app.models.item import ItemCategory
+from app.services.cache import TTLCache
+
+# Product data changes rarely; misses are retried sooner in case the
+# product gets added to the database
+_LOOKUP_TTL = 86400.0
+_MISS_TTL = 3600.0
+
+# Sentinel so a cached "not found" is distinguishable from a cache miss
+_NOT_FOUND = object()
+
+# Compiled once; strips separators and whitespace from scanned barcodes
+_NON_DIGIT_RE = re.compile(r'\D')
+
+# Bounded: keys are client-supplied barcodes, so without a cap a user
+# scanning random codes could grow the process without limit
+_lookup_cache = TTLCache(default_ttl=_LOOKUP_TTL, maxsize=10_000)
+
+# Shared client reused across lookups: keep-alive connections skip the
+# TCP + TLS handshake on repeat calls to the same API host. httpx
+# opens nothing until first use and the client is thread-safe.
+_HTTP_CLIENT = httpx.Client(
+    timeout=10.0,
+    headers={'User-Agent': 'SmartFridge/1.0 (https://github.com/smartfridge)'},
+    limits=httpx.Limits(max_keepalive_connections=20),
+)
 
 
 @dataclass
@@ -118,58 +143,102 @@ CATEGORY_MAPPING = {
 }
 
 
+# One compiled alternation over all mapping keywords, longest first so
+# a longer keyword beats its own prefix; a single regex pass replaces
+# ~50 separate substring scans per tag
+_KEYWORD_RE = re.compile('|'.join(
+    re.escape(keyword)
+    for keyword in sorted(CATEGORY_MAPPING, key=len, reverse=True)
+))
+
+
+def _match_category(text: str) -> Optional[str]:
+    """
+    Find the category for the first mapping keyword in a string.
+
+    Args:
+        text: Lowercased text to scan.
+
+    Returns:
+        ItemCategory value, or None if no keyword matches.
+    """
+    match = _KEYWORD_RE.search(text)
+    return CATEGORY_MAPPING[match.group(0)] if match else None
+
+
 def _detect_category(categories_tags: list, product_name: str) -> str:
     """
     Detect item category from Open Food Facts tags.
-    
+
     Args:
         categories_tags: List of category tags from API.
         product_name: Product name for fallback matching.
-    
+
     Returns:
         ItemCategory value.
     """
     # Check category tags first
     for tag in categories_tags:
-        tag_lower = tag.lower().replace('en:', '').replace('-', ' ')
-        for keyword, category in CATEGORY_MAPPING.items():
-            if keyword in tag_lower:
-                return category
-    
-    # Fallback: check product name
-    name_lower = product_name.lower()
-    for keyword, category in CATEGORY_MAPPING.items():
-        if keyword in name_lower:
+        category = _match_category(tag.lower().replace('en:', '').replace('-', ' '))
+        if category is not None:
             return category
-    
+
+    # Fallback: check product name
+    category = _match_category(product_name.lower())
+    if category is not None:
+        return category
+
     return ItemCategory.OTHER.value
 
 
 def lookup_barcode(barcode: str) -> Optional[ProductInfo]:
     """
     Look up product information by barcode using Open Food Facts API.
-    
+
+    Results (including "not found") are cached in process memory, so
+    repeat scans of common barcodes skip the network round-trip.
+
     Args:
         barcode: Product barcode (EAN/UPC).
-    
+
     Returns:
         ProductInfo if found, None otherwise.
     """
     # Clean barcode - remove any non-digit characters
-    barcode = re.sub(r'\D', '', barcode)
-    
+    barcode = _NON_DIGIT_RE.sub('', barcode)
+
     if not barcode or len(barcode) < 8:
         return None
-    
+
+    cached = _lookup_cache.get(barcode)
+    if cached is not None:
+        return None if cached is _NOT_FOUND else cached
+
+    product = _fetch_product(barcode)
+    _lookup_cache.set(
+        barcode,
+        product if product is not None else _NOT_FOUND,
+        ttl=_LOOKUP_TTL if product is not None else _MISS_TTL,
+    )
+    return product
+
+
+def _fetch_product(barcode: str) -> Optional[ProductInfo]:
+    """
+    Fetch product information from Open Food Facts.
+
+    Args:
+        barcode: Normalised (digits-only) barcode.
+
+    Returns:
+        ProductInfo if found, None otherwise.
+    """
     try:
         # Open Food Facts API - free, no key needed
         url = f"https://world.openfoodfacts.org/api/v2/product/{barcode}.json"
-        
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url, headers={
-                'User-Agent': 'SmartFridge/1.0 (https://github.com/smartfridge)'
-            })
-        
+
+        response = _HTTP_CLIENT.get(url)
+
         if response.status_code != 200:
             return None
         
@@ -219,24 +288,51 @@ def lookup_barcode(barcode: str) -> Optional[ProductInfo]:
 def lookup_barcode_upcitemdb(barcode: str) -> Optional[ProductInfo]:
     """
     Alternative lookup using UPCitemdb API (free tier: 100 req/day).
-    
+
+    Results are cached like lookup_barcode's - doubly worthwhile here,
+    where every avoided call also preserves the daily request quota.
+
     Args:
         barcode: Product barcode (EAN/UPC).
-    
+
     Returns:
         ProductInfo if found, None otherwise.
     """
-    barcode = re.sub(r'\D', '', barcode)
-    
+    barcode = _NON_DIGIT_RE.sub('', barcode)
+
     if not barcode or len(barcode) < 8:
         return None
-    
+
+    # Provider-prefixed key keeps this out of the Open Food Facts entries
+    cache_key = f'upcitemdb:{barcode}'
+    cached = _lookup_cache.get(cache_key)
+    if cached is not None:
+        return None if cached is _NOT_FOUND else cached
+
+    product = _fetch_product_upcitemdb(barcode)
+    _lookup_cache.set(
+        cache_key,
+        product if product is not None else _NOT_FOUND,
+        ttl=_LOOKUP_TTL if product is not None else _MISS_TTL,
+    )
+    return product
+
+
+def _fetch_product_upcitemdb(barcode: str) -> Optional[ProductInfo]:
+    """
+    Fetch product information from UPCitemdb.
+
+    Args:
+        barcode: Normalised (digits-only) barcode.
+
+    Returns:
+        ProductInfo if found, None otherwise.
+    """
     try:
         url = f"https://api.upcitemdb.com/prod/trial/lookup?upc={barcode}"
-        
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(url)
-        
+
+        response = _HTTP_CLIENT.get(url)
+
         if response.status_code != 200:
             return None
         
@@ -253,11 +349,7 @@ def lookup_barcode_upcitemdb(barcode: str) -> Optional[ProductInfo]:
         category = item.get('category', '').lower()
         
         # Map category
-        detected_category = ItemCategory.OTHER.value
-        for keyword, cat in CATEGORY_MAPPING.items():
-            if keyword in category:
-                detected_category = cat
-                break
+        detected_category = _match_category(category) or ItemCategory.OTHER.value
         
         return ProductInfo(
             barcode=barcode,
@@ -0,0 +1,132 @@
+"""
+In-process TTL cache for SmartFridge application.
+
+Provides a small time-based cache for values that are expensive to
+compute but tolerate short staleness (dashboard statistics, tag lists).
+Entries live in process memory, so workers each hold their own copy and
+cached values disappear on restart - appropriate for short TTLs only.
+"""
+
+import time
+from threading import Lock
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Simple thread-safe cache with per-entry time-to-live.
+
+    Bounded: once maxsize entries are held, storing another first
+    drops expired entries, then the least recently used, so a cache
+    keyed on unbounded input (user ids, barcodes) cannot grow without
+    limit.
+
+    Attributes:
+        default_ttl: Default entry lifetime in seconds.
+        maxsize: Maximum number of entries held at once.
+    """
+
+    def __init__(self, default_ttl: float = 30.0, maxsize: int = 4096):
+        """
+        Initialise the cache.
+
+        Args:
+            default_ttl: Default entry lifetime in seconds.
+            maxsize: Maximum number of entries held at once.
+        """
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        # Insertion-ordered; entries are re-inserted on hit so the
+        # front of the dict is always the least recently used
+        self._entries: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = Lock()
+
+    def get(self, key: Any) -> Optional[Any]:
+        """
+        Get a cached value if present and not expired.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached value or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            # Mark as recently used
+            del self._entries[key]
+            self._entries[key] = entry
+            return value
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value with a time-to-live.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: Entry lifetime in seconds (defaults to default_ttl).
+        """
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.maxsize:
+                self._evict_locked()
+            self._entries[key] = (expires_at, value)
+
+    def _evict_locked(self) -> None:
+        """
+        Make room for one entry; the caller must hold the lock.
+
+        Expired entries go first - same-key access is the only other
+        place they are reaped - then the least recently used.
+        """
+        now = time.monotonic()
+        expired = [
+            key for key, (expires_at, _) in self._entries.items()
+            if now >= expires_at
+        ]
+        for key in expired:
+            del self._entries[key]
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def get_or_set(self, key: Any, factory: Callable[[], Any],
+                   ttl: Optional[float] = None) -> Any:
+        """
+        Get a cached value, computing and storing it on a miss.
+
+        Args:
+            key: Cache key.
+            factory: Zero-argument callable producing the value.
+            ttl: Entry lifetime in seconds (defaults to default_ttl).
+
+        Returns:
+            Cached or freshly computed value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = factory()
+            self.set(key, value, ttl=ttl)
+        return value
+
+    def delete(self, key: Any) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key: Cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,33 @@
+"""
+JSON provider for SmartFridge API responses.
+
+Centralises serialisation of the types the API endpoints return so the
+routes can hand model-derived values straight to jsonify.
+"""
+
+from datetime import date, datetime
+from enum import Enum
+
+from flask.json.provider import DefaultJSONProvider
+
+
+class AppJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider tuned for API responses.
+
+    Skips Flask's default per-dict key sorting and knows how to
+    serialise the date and enum values the models expose, so endpoints
+    no longer convert each field by hand.
+    """
+
+    sort_keys = False
+    compact = True
+
+    @staticmethod
+    def default(obj):
+        """Serialise dates as ISO strings and enums as their values."""
+        if isinstance(obj, (date, datetime)):
+            return obj.isoformat()
+        if isinstance(obj, Enum):
+            return obj.value
+        return DefaultJSONProvider.default(obj)
@@ -2,6 +2,7 @@
 Recipe services package.
 """
 
+from app.services.recipes.matching import match_items_to_ingredients
 from app.services.recipes.rules_engine import RulesEngine, get_rules_engine
 from app.services.recipes.ai_adapter import (
     get_ai_adapter,
@@ -12,6 +13,7 @@ from app.services.recipes.ai_adapter import (
 )
 
 __all__ = [
+    'match_items_to_ingredients',
     'RulesEngine',
     'get_rules_engine',
     'get_ai_adapter',
@@ -0,0 +1,104 @@
+"""
+Ingredient matching service.
+
+Matches fridge item names against recipe ingredient lines without the
+per-pair string scans the cook view used to run inline.
+
+The inline baseline matched any item word as a raw substring of a
+line; the inverted index instead matches on punctuation-stripped
+tokens plus naive singular variants. That keeps the matches people
+rely on (plurals, punctuation) while dropping accidental cross-word
+hits like "corn" inside "cornflour" - a deliberate trade for indexed
+lookups over per-pair scans. The whole-name substring fallback below
+is unchanged from the baseline.
+"""
+
+import re
+from collections import defaultdict
+from typing import List, Optional, Tuple
+
+# Words shorter than this carry no matching signal ("of", "a", "to")
+_MIN_TOKEN_LENGTH = 3
+
+# Alphanumeric runs only, so "tomatoes," and "(diced)" tokenise cleanly
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def _tokenise(text: str) -> frozenset:
+    """
+    Split a lowercased string into its significant words.
+
+    Punctuation is stripped - ingredient lines are full of it
+    ("2 tomatoes, diced") - and each word also contributes naive
+    singular variants ("tomatoes" yields "tomato" too). Both sides of
+    a match are tokenised the same way, so plural item names still
+    meet singular ingredient lines and vice versa.
+
+    Args:
+        text: Already-lowercased text to split.
+
+    Returns:
+        Frozenset of normalised words and their singular variants.
+    """
+    tokens = set()
+    for word in _WORD_RE.findall(text):
+        if len(word) < _MIN_TOKEN_LENGTH:
+            continue
+        tokens.add(word)
+        if word.endswith('ies') and len(word) > 4:
+            tokens.add(word[:-3] + 'y')
+        elif word.endswith('es') and len(word) > 4:
+            tokens.add(word[:-2])
+        if word.endswith('s') and len(word) > 3:
+            tokens.add(word[:-1])
+    return frozenset(tokens)
+
+
+def match_items_to_ingredients(
+    item_names: List[str],
+    ingredient_lines: List[str],
+) -> List[Optional[Tuple[int, str]]]:
+    """
+    Match each item name to the first ingredient line it appears in.
+
+    The ingredient lines are inverted into a token -> line-index map
+    once, so each item resolves its word matches with dict lookups
+    instead of comparing against every line; only the whole-name
+    substring fallback still scans lines, and only up to the best
+    token hit.
+
+    Args:
+        item_names: Fridge item names, in display order.
+        ingredient_lines: Recipe ingredient lines.
+
+    Returns:
+        One entry per item name: a (line_index, line) tuple for the
+        first matching ingredient line, or None if nothing matched.
+    """
+    lines_lower = [line.lower() for line in ingredient_lines]
+
+    token_to_lines = defaultdict(list)
+    for i, line_lower in enumerate(lines_lower):
+        for token in _tokenise(line_lower):
+            token_to_lines[token].append(i)
+
+    results: List[Optional[Tuple[int, str]]] = []
+    for name in item_names:
+        name_lower = name.lower()
+
+        # Earliest line sharing a token with the item name
+        best = min(
+            (token_to_lines[token][0]
+             for token in _tokenise(name_lower) if token in token_to_lines),
+            default=None,
+        )
+
+        # A whole-name substring match on an earlier line still wins
+        stop = best if best is not None else len(lines_lower)
+        for i in range(stop):
+            if name_lower in lines_lower[i]:
+                best = i
+                break
+
+        results.append((best, ingredient_lines[best]) if best is not None else None)
+    return results
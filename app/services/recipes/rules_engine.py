@@ -9,7 +9,7 @@ import json
 import os
 from pathlib import Path
 from typing import List, Dict, Optional, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from app.models.item import Item
 from app.models.recipe import RecipeDraft
@@ -26,6 +26,10 @@ class CanonicalRecipe:
     prep_time_minutes: int
     cook_time_minutes: int
     tags: List[str]
+    # Normalised ingredient names, precomputed at load time so scoring
+    # does no string cleanup per request
+    required_norm: List[str] = field(default_factory=list)
+    optional_norm: List[str] = field(default_factory=list)
 
 
 class RulesEngine:
@@ -60,19 +64,29 @@ class RulesEngine:
         try:
             with open(self.recipes_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                self._recipes = [
-                    CanonicalRecipe(
+                self._recipes = []
+                for r in data.get('recipes', []):
+                    ingredients = r.get('ingredients', [])
+                    required_norm = []
+                    optional_norm = []
+                    for ing in ingredients:
+                        name = self._normalise_ingredient(ing.get('name', ''))
+                        if ing.get('optional', False):
+                            optional_norm.append(name)
+                        else:
+                            required_norm.append(name)
+                    self._recipes.append(CanonicalRecipe(
                         id=r.get('id', ''),
                         title=r.get('title', ''),
-                        ingredients=r.get('ingredients', []),
+                        ingredients=ingredients,
                         instructions=r.get('instructions', []),
                         servings=r.get('servings', 4),
                         prep_time_minutes=r.get('prep_time_minutes', 15),
                         cook_time_minutes=r.get('cook_time_minutes', 30),
                         tags=r.get('tags', []),
-                    )
-                    for r in data.get('recipes', [])
-                ]
+                        required_norm=required_norm,
+                        optional_norm=optional_norm,
+                    ))
         except (FileNotFoundError, json.JSONDecodeError) as e:
             # Log warning but don't fail - empty recipes list
             self._recipes = []
@@ -114,7 +128,7 @@ class RulesEngine:
         self,
         recipe: CanonicalRecipe,
         available: Set[str],
-        items: List[Item]
+        items_dict: Dict[str, Item]
     ) -> tuple[float, List[str]]:
         """
         Calculate match score for a recipe.
@@ -127,21 +141,14 @@ class RulesEngine:
         Args:
             recipe: Recipe to score.
             available: Set of available ingredient names.
-            items: Original items list for freshness check.
+            items_dict: Normalised item name -> Item, for freshness.
         
         Returns:
             Tuple of (score 0-100, list of missing ingredients).
         """
-        required_ingredients = []
-        optional_ingredients = []
-        
-        for ing in recipe.ingredients:
-            name = self._normalise_ingredient(ing.get('name', ''))
-            if ing.get('optional', False):
-                optional_ingredients.append(name)
-            else:
-                required_ingredients.append(name)
-        
+        required_ingredients = recipe.required_norm
+        optional_ingredients = recipe.optional_norm
+
         # Check which ingredients are available
         missing = []
         matched_required = 0
@@ -170,8 +177,7 @@ class RulesEngine:
         
         # Freshness bonus (up to 10 points)
         freshness_bonus = 0.0
-        items_dict = {self._normalise_ingredient(i.name): i for i in items}
-        
+
         for ing in required_ingredients:
             for avail_name, item in items_dict.items():
                 if ing in avail_name or avail_name in ing:
@@ -211,10 +217,12 @@ class RulesEngine:
             return []
         
         available = self._get_available_ingredients(items)
+        # Built once per request; scoring reuses it for every recipe
+        items_dict = {self._normalise_ingredient(i.name): i for i in items}
         scored_recipes: List[tuple[float, CanonicalRecipe, List[str]]] = []
-        
+
         for recipe in self._recipes:
-            score, missing = self._calculate_match_score(recipe, available, items)
+            score, missing = self._calculate_match_score(recipe, available, items_dict)
             if score >= min_score:
                 scored_recipes.append((score, recipe, missing))
         
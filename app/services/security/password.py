@@ -11,6 +11,14 @@ import bcrypt
 from flask import current_app
 
 
+# Precompiled character-class probes; each check is a single C-level
+# scan instead of a per-call pattern compile and Python-level loop
+_HAS_UPPER = re.compile(r'[A-Z]').search
+_HAS_LOWER = re.compile(r'[a-z]').search
+_HAS_DIGIT = re.compile(r'\d').search
+_HAS_SPECIAL = re.compile(r'[!@#$%^&*(),.?":{}|<>_\-+=\[\]\\;\'`~]').search
+
+
 class PasswordService:
     """
     Service class for password hashing and validation.
@@ -83,16 +91,16 @@ class PasswordService:
         if len(password) < min_length:
             errors.append(f'Password must be at least {min_length} characters long.')
         
-        if require_uppercase and not re.search(r'[A-Z]', password):
+        if require_uppercase and not _HAS_UPPER(password):
             errors.append('Password must contain at least one uppercase letter.')
-        
-        if require_lowercase and not re.search(r'[a-z]', password):
+
+        if require_lowercase and not _HAS_LOWER(password):
             errors.append('Password must contain at least one lowercase letter.')
-        
-        if require_digit and not re.search(r'\d', password):
+
+        if require_digit and not _HAS_DIGIT(password):
             errors.append('Password must contain at least one digit.')
-        
-        if require_special and not re.search(r'[!@#$%^&*(),.?":{}|<>_\-+=\[\]\\;\'`~]', password):
+
+        if require_special and not _HAS_SPECIAL(password):
             errors.append('Password must contain at least one special character.')
         
         return (len(errors) == 0, errors)
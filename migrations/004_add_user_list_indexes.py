@@ -0,0 +1,32 @@
+"""
+Add index on users.created_at for paginated user listings.
+
+The admin user lists order by created_at with LIMIT/OFFSET; this index
+lets the database serve each page with an index scan instead of sorting
+the whole table.
+
+Run this migration with:
+    flask db upgrade
+
+Or manually with SQLite:
+    CREATE INDEX idx_users_created_at ON users(created_at);
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '004_add_user_list_indexes'
+down_revision = '003_add_barcode_support'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add created_at index to users table."""
+    op.create_index('idx_users_created_at', 'users', ['created_at'])
+
+
+def downgrade():
+    """Remove created_at index from users table."""
+    op.drop_index('idx_users_created_at', table_name='users')
@@ -0,0 +1,31 @@
+"""
+Add composite index on users(role, is_active).
+
+Backs the EXISTS checks used by the admin "last admin" guards so the
+database can answer them with an index probe rather than a table scan.
+
+Run this migration with:
+    flask db upgrade
+
+Or manually with SQLite:
+    CREATE INDEX idx_users_role_active ON users(role, is_active);
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '005_add_user_role_index'
+down_revision = '004_add_user_list_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add role/is_active index to users table."""
+    op.create_index('idx_users_role_active', 'users', ['role', 'is_active'])
+
+
+def downgrade():
+    """Remove role/is_active index from users table."""
+    op.drop_index('idx_users_role_active', table_name='users')
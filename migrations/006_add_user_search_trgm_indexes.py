@@ -0,0 +1,44 @@
+"""
+Add trigram GIN indexes for the admin user search (PostgreSQL only).
+
+The admin users list searches username and email with ILIKE '%term%',
+which cannot use a btree index. On PostgreSQL, pg_trgm GIN indexes
+serve these substring ILIKEs directly, so the query itself stays
+unchanged. SQLite (development/testing) has no equivalent and keeps
+scanning, which is fine at dev-database sizes.
+
+Run this migration with:
+    flask db upgrade
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '006_add_user_search_trgm_indexes'
+down_revision = '005_add_user_role_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add pg_trgm GIN indexes on users.username and users.email."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX idx_users_username_trgm ON users '
+        'USING gin (username gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX idx_users_email_trgm ON users '
+        'USING gin (email gin_trgm_ops)'
+    )
+
+
+def downgrade():
+    """Remove the trigram indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP INDEX IF EXISTS idx_users_username_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_users_email_trgm')
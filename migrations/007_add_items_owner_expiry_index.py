@@ -0,0 +1,38 @@
+"""
+Add composite index on items (owner_id, expiry_date) for databases
+created before the model declared it.
+
+The dashboard's expiring/expired queries and the items list all filter
+on owner_id plus an expiry_date range; this index serves both predicates
+in one scan. db.create_all() has built it for fresh databases since the
+model gained the Index declaration, so it is created here only when
+missing.
+
+Run this migration with:
+    flask db upgrade
+
+Or manually with SQLite:
+    CREATE INDEX IF NOT EXISTS idx_items_owner_expiry ON items(owner_id, expiry_date);
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '007_add_items_owner_expiry_index'
+down_revision = '006_add_user_search_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add (owner_id, expiry_date) index to items table if missing."""
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_items_owner_expiry '
+        'ON items(owner_id, expiry_date)'
+    )
+
+
+def downgrade():
+    """Remove the (owner_id, expiry_date) index from items table."""
+    op.execute('DROP INDEX IF EXISTS idx_items_owner_expiry')
@@ -0,0 +1,49 @@
+"""
+Add trigram GIN indexes for the sites search (PostgreSQL only).
+
+The sites list searches title, url and tags with ILIKE '%term%' joined
+by OR; pg_trgm GIN indexes on each column let PostgreSQL answer that
+with bitmap index scans instead of a sequential scan, with no change to
+the query. SQLite (development/testing) has no equivalent and keeps
+scanning, which is fine at dev-database sizes.
+
+Run this migration with:
+    flask db upgrade
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '008_add_site_search_trgm_indexes'
+down_revision = '007_add_items_owner_expiry_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add pg_trgm GIN indexes on sites.title, sites.url and sites.tags."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX idx_sites_title_trgm ON sites '
+        'USING gin (title gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX idx_sites_url_trgm ON sites '
+        'USING gin (url gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX idx_sites_tags_trgm ON sites '
+        'USING gin (tags gin_trgm_ops)'
+    )
+
+
+def downgrade():
+    """Remove the trigram indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP INDEX IF EXISTS idx_sites_title_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_sites_url_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_sites_tags_trgm')
@@ -0,0 +1,41 @@
+"""
+Add a covering index for the expiring-soon listing (PostgreSQL only).
+
+Item.get_expiring_soon filters on owner_id plus an expiry_date range
+and orders by expiry_date; idx_items_owner_expiry serves the scan, but
+every matching row still costs a heap fetch for the displayed columns.
+An INCLUDE index carries name, quantity and category in its leaves so
+the listing becomes a single index-only scan. SQLite has no INCLUDE
+clause and keeps using the existing composite, which is fine at
+dev-database sizes.
+
+Run this migration with:
+    flask db upgrade
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '009_add_items_expiring_covering_index'
+down_revision = '008_add_site_search_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add covering (owner_id, expiry_date) INCLUDE index on items."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        'CREATE INDEX idx_items_owner_expiry_covering '
+        'ON items (owner_id, expiry_date) '
+        'INCLUDE (name, quantity, category)'
+    )
+
+
+def downgrade():
+    """Remove the covering index."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP INDEX IF EXISTS idx_items_owner_expiry_covering')
@@ -0,0 +1,51 @@
+"""
+Add trigram GIN indexes for the item and recipe searches (PostgreSQL
+only).
+
+Item.search and the recipes list filter with ILIKE '%term%', which a
+B-tree cannot serve; pg_trgm GIN indexes on items.name, recipes.title
+and recipes.ingredients_text let PostgreSQL answer those predicates
+with bitmap index scans instead of sequential scans, with no change to
+the queries. SQLite (development/testing) has no equivalent and keeps
+scanning, which is fine at dev-database sizes.
+
+Run this migration with:
+    flask db upgrade
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '010_add_item_recipe_search_trgm_indexes'
+down_revision = '009_add_items_expiring_covering_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add pg_trgm GIN indexes on items.name and the recipe search columns."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        'CREATE INDEX idx_items_name_trgm ON items '
+        'USING gin (name gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX idx_recipes_title_trgm ON recipes '
+        'USING gin (title gin_trgm_ops)'
+    )
+    op.execute(
+        'CREATE INDEX idx_recipes_ingredients_trgm ON recipes '
+        'USING gin (ingredients_text gin_trgm_ops)'
+    )
+
+
+def downgrade():
+    """Remove the trigram indexes."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('DROP INDEX IF EXISTS idx_items_name_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_recipes_title_trgm')
+    op.execute('DROP INDEX IF EXISTS idx_recipes_ingredients_trgm')
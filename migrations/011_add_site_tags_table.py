@@ -0,0 +1,62 @@
+"""
+Add the normalised site_tags table and backfill it from sites.tags.
+
+Tag lookups previously ran ILIKE '%tag%' over the comma-separated
+sites.tags column - a per-user sequential scan that also matches
+substrings ("milk" finds "buttermilk"). One row per tag with an
+(owner_id, tag) btree index turns tag filtering and the tag dropdown
+into index-bound equality queries. The tags string column stays as the
+display form; the model keeps both in sync on write.
+
+Run this migration with:
+    flask db upgrade
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '011_add_site_tags_table'
+down_revision = '010_add_item_recipe_search_trgm_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create site_tags, index it, and backfill from existing rows."""
+    op.create_table(
+        'site_tags',
+        sa.Column('id', sa.Integer, primary_key=True),
+        sa.Column('site_id', sa.Integer, sa.ForeignKey('sites.id'), nullable=False),
+        sa.Column('owner_id', sa.Integer, sa.ForeignKey('users.id'), nullable=False),
+        sa.Column('tag', sa.String(64), nullable=False),
+    )
+    op.create_index('ix_site_tags_site_id', 'site_tags', ['site_id'])
+    op.create_index('idx_site_tags_owner_tag', 'site_tags', ['owner_id', 'tag'])
+
+    # Backfill by splitting in Python rather than string_to_array so
+    # the same migration runs on SQLite development databases
+    bind = op.get_bind()
+    sites = bind.execute(sa.text(
+        "SELECT id, owner_id, tags FROM sites WHERE tags IS NOT NULL AND tags != ''"
+    )).fetchall()
+    rows = []
+    for site_id, owner_id, tags in sites:
+        for tag in tags.split(','):
+            tag = tag.strip()
+            if tag:
+                rows.append({'site_id': site_id, 'owner_id': owner_id,
+                             'tag': tag[:64]})
+    if rows:
+        bind.execute(sa.text(
+            'INSERT INTO site_tags (site_id, owner_id, tag) '
+            'VALUES (:site_id, :owner_id, :tag)'
+        ), rows)
+
+
+def downgrade():
+    """Drop the site_tags table."""
+    op.drop_index('idx_site_tags_owner_tag', table_name='site_tags')
+    op.drop_index('ix_site_tags_site_id', table_name='site_tags')
+    op.drop_table('site_tags')
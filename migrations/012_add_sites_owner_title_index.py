@@ -0,0 +1,38 @@
+"""
+Add composite index on sites (owner_id, title) for databases created
+before the model declared it.
+
+Site.get_by_owner and every sites listing filter on owner_id and order
+by title; this index serves the filter and hands rows back already
+sorted, removing the per-request sort. db.create_all() builds it for
+fresh databases now that the model declares the Index, so it is created
+here only when missing.
+
+Run this migration with:
+    flask db upgrade
+
+Or manually with SQLite:
+    CREATE INDEX IF NOT EXISTS idx_sites_owner_title ON sites(owner_id, title);
+"""
+
+from alembic import op
+
+
+# revision identifiers
+revision = '012_add_sites_owner_title_index'
+down_revision = '011_add_site_tags_table'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add (owner_id, title) index to sites table if missing."""
+    op.execute(
+        'CREATE INDEX IF NOT EXISTS idx_sites_owner_title '
+        'ON sites(owner_id, title)'
+    )
+
+
+def downgrade():
+    """Remove the (owner_id, title) index from sites table."""
+    op.execute('DROP INDEX IF EXISTS idx_sites_owner_title')
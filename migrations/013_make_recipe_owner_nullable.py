@@ -0,0 +1,39 @@
+"""
+Allow NULL in recipes.owner_id for public (seeded) recipes.
+
+The seed-recipes command has always written canonical recipes with no
+owner - its duplicate check even filters on owner_id IS NULL - but the
+column was declared NOT NULL, so every run died with an IntegrityError.
+Relaxing the constraint makes ownerless public recipes representable;
+user-facing queries filter on a concrete owner_id and never see them.
+
+Run this migration with:
+    flask db upgrade
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '013_make_recipe_owner_nullable'
+down_revision = '012_add_sites_owner_title_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Drop the NOT NULL constraint on recipes.owner_id."""
+    # batch mode rebuilds the table on SQLite, which cannot alter a
+    # column in place; on PostgreSQL it is a plain ALTER COLUMN
+    with op.batch_alter_table('recipes') as batch_op:
+        batch_op.alter_column('owner_id', existing_type=sa.Integer(),
+                              nullable=True)
+
+
+def downgrade():
+    """Restore NOT NULL on recipes.owner_id (public recipes must go first)."""
+    op.execute('DELETE FROM recipes WHERE owner_id IS NULL')
+    with op.batch_alter_table('recipes') as batch_op:
+        batch_op.alter_column('owner_id', existing_type=sa.Integer(),
+                              nullable=False)
@@ -0,0 +1,79 @@
+"""
+SmartFridge Test Suite - Ingredient Matching Tests
+
+Tests for the recipes matching service used by the cook view.
+"""
+from app.services.recipes.matching import match_items_to_ingredients
+
+
+class TestIngredientMatching:
+    """Behaviour tests for match_items_to_ingredients."""
+
+    def test_plural_ingredient_matches_plural_item(self):
+        """Test punctuation after a word does not break the match."""
+        matches = match_items_to_ingredients(
+            ['Cherry Tomatoes'],
+            ['2 tomatoes, diced', '1 tbsp olive oil'],
+        )
+
+        assert matches == [(0, '2 tomatoes, diced')]
+
+    def test_item_word_matches_despite_trailing_punctuation(self):
+        """Test a single-word overlap survives commas in the line."""
+        matches = match_items_to_ingredients(
+            ['Red Onion'],
+            ['1 onion, chopped finely'],
+        )
+
+        assert matches == [(0, '1 onion, chopped finely')]
+
+    def test_singular_item_matches_plural_ingredient(self):
+        """Test plural/singular forms are treated as equivalent."""
+        matches = match_items_to_ingredients(
+            ['Tomato', 'Grape'],
+            ['3 tomatoes', '200g grapes'],
+        )
+
+        assert matches == [(0, '3 tomatoes'), (1, '200g grapes')]
+
+    def test_whole_name_substring_match(self):
+        """Test a multi-word item name matches its full phrase."""
+        matches = match_items_to_ingredients(
+            ['olive oil'],
+            ['1 tbsp olive oil'],
+        )
+
+        assert matches == [(0, '1 tbsp olive oil')]
+
+    def test_unmatched_item_returns_none(self):
+        """Test an item absent from every line yields None."""
+        matches = match_items_to_ingredients(
+            ['Cheddar Cheese'],
+            ['2 eggs', '1 tbsp butter'],
+        )
+
+        assert matches == [None]
+
+    def test_earliest_matching_line_wins(self):
+        """Test the first matching line is returned, not a later one."""
+        matches = match_items_to_ingredients(
+            ['Eggs'],
+            ['4 eggs, beaten', 'more eggs for glazing'],
+        )
+
+        assert matches == [(0, '4 eggs, beaten')]
+
+    def test_short_words_do_not_match(self):
+        """Test words under three characters carry no signal."""
+        matches = match_items_to_ingredients(
+            ['Jam'],
+            ['a jar of it'],
+        )
+
+        assert matches == [None]
+
+    def test_no_ingredients_matches_nothing(self):
+        """Test an empty ingredient list yields None per item."""
+        matches = match_items_to_ingredients(['Milk'], [])
+
+        assert matches == [None]